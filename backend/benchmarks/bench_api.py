@@ -0,0 +1,353 @@
+"""Load-test the API in-process and compare runs against a stored baseline.
+
+The app is driven through httpx's ASGI transport, so no server or network
+is involved. Ollama is replaced by a stub that answers pulls instantly, and
+configs live in a throwaway directory (memory-backed ``/dev/shm`` where
+available). Each endpoint is warmed up once, then hammered by
+``--concurrency`` workers; latency percentiles and throughput are reported
+per config size, endpoint and concurrency level.
+
+Every route is covered, with two adjustments. The admin profile routes get
+a throwaway token and one stored profile to list and download. The
+transport buffers whole responses, so ``/roadmap/events`` is measured with
+the broker closed: each request gets the progress snapshot and ends, which
+is the time to the first event rather than the life of a stream.
+
+Run from the backend directory::
+
+    python -m benchmarks.bench_api --sizes 1KB,1MB,10MB --concurrency 1,16
+    python -m benchmarks.bench_api --save-baseline benchmarks/baselines/api.json
+    python -m benchmarks.bench_api --compare benchmarks/baselines/api.json
+
+With ``--compare`` the exit status is 1 when any p95 latency or throughput
+is worse than the baseline by more than ``--tolerance``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import cProfile
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+from datetime import date, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+import httpx
+from src.integrations.providers import ollama
+from src.main import app
+from src.services.profiling import ProfileStore, RequestProfiler
+from src.services.progress_events import ProgressBroker
+from src.services.resource_search import ResourceSearch
+from src.services.roadmap_store import RoadmapStore
+
+_UNITS = {"B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3}
+_WORDS = (
+    "python git sql algorithms statistics pytorch transformers rag agents "
+    "evaluation mlops docker kubernetes vectors embeddings safety leadership"
+).split()
+_START = date(2025, 6, 21)
+_PROFILE_TOKEN = "bench"
+_PROFILE_ID = "0-0-bench"
+
+# (method, path) pairs exercised for every config size
+ENDPOINTS = [
+    ("GET", "/"),
+    ("GET", "/health"),
+    ("GET", "/roadmap"),
+    ("GET", "/roadmap?fields=metadata,phases.*.title"),
+    ("GET", "/roadmap/phases/phase1?limit=50"),
+    ("GET", "/roadmap/weeks/1"),
+    ("GET", "/roadmap/schedule?date=2025-07-01"),
+    ("GET", "/search?q=python+agents"),
+    ("GET", "/metrics"),
+    ("GET", "/roadmap/events"),
+    ("GET", "/admin/profiles"),
+    ("GET", f"/admin/profiles/{_PROFILE_ID}"),
+    ("GET", f"/admin/profiles/{_PROFILE_ID}?format=text"),
+    ("POST", "/roadmap/fix-sequence"),
+    ("POST", "/ollama/sync"),
+]
+
+
+def parse_size(text: str) -> int:
+    text = text.strip().upper()
+    for unit in sorted(_UNITS, key=len, reverse=True):
+        if text.endswith(unit):
+            return int(float(text[: -len(unit)]) * _UNITS[unit])
+    return int(text)
+
+
+def _node(rng: random.Random, phase: int, n: int) -> dict[str, Any]:
+    words = rng.sample(_WORDS, 3)
+    return {
+        "id": f"p{phase}-n{n}",
+        "title": " ".join(words).title(),
+        "type": rng.choice(("learn", "practice", "build")),
+        "progress": rng.randint(0, 100),
+        "resources": [
+            {
+                "title": f"{w.title()} guide {n}",
+                "url": f"https://example.com/{phase}/{n}/{w}",
+                "type": "article",
+            }
+            for w in words[:2]
+        ],
+    }
+
+
+def synthetic_roadmap(size: int, seed: int = 0, phases: int = 6) -> dict[str, Any]:
+    """A config shaped like roadmap-config-2025.json of roughly ``size`` bytes."""
+    rng = random.Random(seed)
+    weeks = phases * 8
+    config: dict[str, Any] = {
+        "metadata": {
+            "title": "Synthetic Roadmap",
+            "version": "13.0",
+            "startDate": _START.isoformat(),
+            "totalWeeks": weeks,
+        },
+        "currentWeek": {
+            "weekNumber": 1,
+            "dailySchedule": {
+                day: {
+                    "date": (_START + timedelta(days=i + 2)).isoformat(),
+                    "morning": f"{rng.choice(_WORDS).title()} study",
+                }
+                for i, day in enumerate(("monday", "tuesday", "wednesday"))
+            },
+        },
+        "phases": {},
+    }
+    for p in range(1, phases + 1):
+        start = _START + timedelta(weeks=(p - 1) * 8)
+        config["phases"][f"phase{p}"] = {
+            "id": f"phase{p}",
+            "title": f"Phase {p}",
+            "order": p,
+            "startDate": start.isoformat(),
+            "endDate": (start + timedelta(weeks=8, days=-1)).isoformat(),
+            "keyDeliverables": [f"Project {w} (Week {w})" for w in range(1, 9)],
+            "resources": {"books": [f"{rng.choice(_WORDS).title()} Handbook"]},
+            "nodes": [],
+        }
+    # Grow the phases node by node until the serialized size is reached
+    base = len(json.dumps(config))
+    per_node = len(json.dumps(_node(rng, 1, 0))) + 2
+    for n in range(max(0, (size - base) // per_node)):
+        p = n % phases + 1
+        config["phases"][f"phase{p}"]["nodes"].append(_node(rng, p, n))
+    return config
+
+
+class _OllamaStub:
+    """Stands in for the requests calls made by the Ollama integration."""
+
+    @staticmethod
+    def post(url: str, json: Any = None, **kwargs: Any) -> Any:
+        status = '{"status":"pulling","digest":"sha256:0","completed":1024}'
+        return SimpleNamespace(status_code=200, text=f"{status}\n")
+
+
+@contextmanager
+def isolated_app(config: dict[str, Any]) -> Iterator[Path]:
+    """Point the app at ``config`` in a scratch directory with Ollama stubbed."""
+
+    async def installed(self: Any) -> bool:
+        return True
+
+    scratch = Path("/dev/shm") if Path("/dev/shm").is_dir() else None
+    with (
+        tempfile.TemporaryDirectory(dir=scratch) as tmp,
+        ExitStack() as stack,
+    ):
+        path = Path(tmp) / "roadmap-config.json"
+        path.write_text(json.dumps(config))
+        store = RoadmapStore(path)
+        # One profile for the admin routes to list and download
+        profiles = ProfileStore(Path(tmp) / "profiles")
+        profile = cProfile.Profile()
+        profile.runcall(json.dumps, config)
+        profiles.save(_PROFILE_ID, profile)
+        for target, value in {
+            "src.main.roadmap_store": store,
+            "src.main.resource_search": ResourceSearch(store),
+            "src.main.progress_store": RoadmapStore(Path(tmp) / "m.json"),
+            # Closed, so event streams end after their snapshot
+            "src.main.progress_broker": ProgressBroker(closed=True),
+            "src.main._last_progress": {},
+            "src.main.request_profiler": RequestProfiler(
+                profiles, _PROFILE_TOKEN, sample_rate=0.0
+            ),
+            "requests.post": _OllamaStub.post,
+        }.items():
+            stack.enter_context(patch(target, value))
+        stack.enter_context(
+            patch.object(
+                ollama.OllamaIntegrationService, "check_ollama_installed", installed
+            )
+        )
+        yield path
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def measure(
+    client: httpx.AsyncClient, method: str, path: str, requests: int, concurrency: int
+) -> dict[str, Any]:
+    latencies: list[float] = []
+    errors = 0
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            response = await client.request(method, path)
+            latencies.append(time.perf_counter() - start)
+            errors += response.status_code >= 400
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1e3,
+        "p95_ms": _percentile(latencies, 0.95) * 1e3,
+        "p99_ms": _percentile(latencies, 0.99) * 1e3,
+    }
+
+
+async def run_size(
+    size: int, requests: int, levels: list[int], seed: int
+) -> list[dict[str, Any]]:
+    config = synthetic_roadmap(size, seed)
+    results = []
+    with isolated_app(config) as path:
+        actual = path.stat().st_size
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport,
+            base_url="http://bench",
+            # Only read by the admin routes; the middleware's profiler has
+            # no token here, so nothing is profiled
+            headers={"X-Profile-Token": _PROFILE_TOKEN},
+        ) as client:
+            for method, endpoint in ENDPOINTS:
+                # Warm caches so runs measure steady state, not the first load
+                await client.request(method, endpoint)
+                for concurrency in levels:
+                    result = await measure(
+                        client, method, endpoint, requests, concurrency
+                    )
+                    result.update(
+                        size=size,
+                        config_bytes=actual,
+                        endpoint=f"{method} {endpoint}",
+                        concurrency=concurrency,
+                    )
+                    results.append(result)
+                    print(
+                        f"{_human(actual):>8} {method:<4} {endpoint:<42} "
+                        f"c={concurrency:<3} {result['throughput']:9.1f} req/s  "
+                        f"p50={result['p50_ms']:8.2f}ms "
+                        f"p95={result['p95_ms']:8.2f}ms "
+                        f"p99={result['p99_ms']:8.2f}ms"
+                        + (f"  errors={result['errors']}" if result["errors"] else "")
+                    )
+    return results
+
+
+def _human(size: int) -> str:
+    for unit in ("GB", "MB", "KB"):
+        if size >= _UNITS[unit]:
+            return f"{size / _UNITS[unit]:.1f}{unit}"
+    return f"{size}B"
+
+
+def _key(result: dict[str, Any]) -> tuple[int, str, int]:
+    return result["size"], result["endpoint"], result["concurrency"]
+
+
+def compare(
+    baseline: list[dict[str, Any]], current: list[dict[str, Any]], tolerance: float
+) -> list[str]:
+    """Describe every result that regressed beyond ``tolerance`` (0.2 = 20%)."""
+    previous = {_key(r): r for r in baseline}
+    regressions = []
+    for result in current:
+        old = previous.get(_key(result))
+        if old is None:
+            continue
+        label = (
+            f"{_human(result['size'])} {result['endpoint']} c={result['concurrency']}"
+        )
+        if result["p95_ms"] > old["p95_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{label}: p95 {old['p95_ms']:.2f}ms -> {result['p95_ms']:.2f}ms"
+            )
+        if result["throughput"] < old["throughput"] / (1 + tolerance):
+            regressions.append(
+                f"{label}: throughput {old['throughput']:.1f} -> "
+                f"{result['throughput']:.1f} req/s"
+            )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1KB,100KB,10MB", help="e.g. 1KB,1MB,100MB")
+    parser.add_argument("--concurrency", default="1,16", help="e.g. 1,16,64")
+    parser.add_argument("--requests", type=int, default=200, help="per measurement")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", type=Path, help="write results to this file")
+    parser.add_argument("--save-baseline", type=Path)
+    parser.add_argument("--compare", type=Path, help="baseline to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    sizes = [parse_size(s) for s in args.sizes.split(",")]
+    levels = [int(c) for c in args.concurrency.split(",")]
+    results: list[dict[str, Any]] = []
+    for size in sizes:
+        results.extend(asyncio.run(run_size(size, args.requests, levels, args.seed)))
+
+    report = {
+        "python": sys.version.split()[0],
+        "cpus": os.cpu_count(),
+        "requests": args.requests,
+        "results": results,
+    }
+    for target in (args.json, args.save_baseline):
+        if target is not None:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(json.dumps(report, indent=2) + "\n")
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text())["results"]
+        regressions = compare(baseline, results, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print(f"no regressions beyond {args.tolerance:.0%} of {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
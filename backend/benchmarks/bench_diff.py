@@ -0,0 +1,142 @@
+"""Benchmark the Merkle diff engine against a naive deep comparison.
+
+Run from the backend directory::
+
+    python -m benchmarks.bench_diff --nodes 200000 --changes 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from collections.abc import Callable
+from typing import Any
+
+from src.services.roadmap_diff import build_tree, diff_configs, diff_trees
+
+
+def synthetic_config(nodes: int, seed: int = 0) -> dict[str, Any]:
+    """A config with 6 phases of weeks, each week holding nodes with resources."""
+    rng = random.Random(seed)
+    per_phase = max(1, nodes // 6)
+    phases = {}
+    for p in range(1, 7):
+        weeks = []
+        for w in range(8):
+            weeks.append(
+                {
+                    "weekNumber": (p - 1) * 8 + w + 1,
+                    "nodes": [
+                        {
+                            "id": f"p{p}-w{w}-n{n}",
+                            "title": f"Topic {rng.randint(0, 10**6)}",
+                            "type": rng.choice(("learn", "practice", "build")),
+                            "progress": rng.randint(0, 100),
+                            "resources": [
+                                {
+                                    "title": f"Resource {rng.randint(0, 10**6)}",
+                                    "url": f"https://example.com/{p}/{w}/{n}/{r}",
+                                }
+                                for r in range(2)
+                            ],
+                        }
+                        for n in range(per_phase // 8)
+                    ],
+                }
+            )
+        phases[f"phase{p}"] = {"id": f"phase{p}", "order": p, "weeks": weeks}
+    return {"metadata": {"version": "13.0", "totalWeeks": 48}, "phases": phases}
+
+
+def mutate(config: dict[str, Any], changes: int, seed: int = 1) -> dict[str, Any]:
+    """Update node progress, copying only the containers on each edited path.
+
+    This is how in-process edits such as RoadmapSequenceFixer share
+    untouched subtrees with the config they started from.
+    """
+    rng = random.Random(seed)
+    mutated = dict(config)
+    mutated["phases"] = phases = dict(config["phases"])
+    for _ in range(changes):
+        pid = rng.choice(list(phases))
+        phases[pid] = phase = dict(phases[pid])
+        phase["weeks"] = weeks = list(phase["weeks"])
+        w = rng.randrange(len(weeks))
+        weeks[w] = week = dict(weeks[w])
+        week["nodes"] = nodes = list(week["nodes"])
+        if nodes:
+            n = rng.randrange(len(nodes))
+            nodes[n] = dict(nodes[n], progress=nodes[n]["progress"] + 1)
+    return mutated
+
+
+def naive_diff(old: Any, new: Any, path: str = "") -> list[str]:
+    """Walk every value of both configs, as a hash-free comparison would."""
+    if isinstance(old, dict) and isinstance(new, dict):
+        out = []
+        for key in old.keys() | new.keys():
+            if key not in old or key not in new:
+                out.append(f"{path}.{key}")
+            else:
+                out.extend(naive_diff(old[key], new[key], f"{path}.{key}"))
+        return out
+    if isinstance(old, list) and isinstance(new, list):
+        out = [
+            f"{path}[{i}]"
+            for i in range(min(len(old), len(new)), max(len(old), len(new)))
+        ]
+        for i, (a, b) in enumerate(zip(old, new, strict=False)):
+            out.extend(naive_diff(a, b, f"{path}[{i}]"))
+        return out
+    return [] if old == new else [path]
+
+
+def _time(label: str, fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    print(f"  {label:<38} {best * 1e3:10.2f} ms")
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=200_000)
+    parser.add_argument("--changes", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    old = synthetic_config(args.nodes)
+    shared = mutate(old, args.changes)
+    # Fresh objects, as when the edited config is re-read from disk
+    new = json.loads(json.dumps(shared))
+    old_tree = build_tree(old)
+    new_tree = build_tree(new)
+    print(f"{args.nodes:,} nodes, {args.changes} modified")
+    assert len(diff_configs(old, new)) == len(naive_diff(old, new))
+
+    _time("naive deep comparison", lambda: naive_diff(old, new), args.repeat)
+    _time("merkle: hash both + diff", lambda: diff_configs(old, new), args.repeat)
+    _time(
+        "merkle: hash new + diff (cached old)",
+        lambda: diff_trees(old_tree, build_tree(new)),
+        args.repeat,
+    )
+    _time(
+        "merkle: rehash edited paths + diff",
+        lambda: diff_trees(old_tree, build_tree(shared, reuse=old_tree)),
+        args.repeat,
+    )
+    _time(
+        "merkle: diff only (both cached)",
+        lambda: diff_trees(old_tree, new_tree),
+        args.repeat,
+    )
+
+
+if __name__ == "__main__":
+    main()
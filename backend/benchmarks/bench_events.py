@@ -0,0 +1,65 @@
+"""Benchmark progress event fan-out to many idle SSE subscribers.
+
+Run from the backend directory::
+
+    python -m benchmarks.bench_events --clients 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from collections.abc import AsyncIterator
+
+from src.services.progress_events import ProgressBroker
+
+
+async def _consume(stream: AsyncIterator[bytes], events: int) -> None:
+    async for frame in stream:
+        if frame.startswith(b"id: ") and int(frame[4 : frame.index(b"\n")]) >= events:
+            return
+
+
+async def run(clients: int, events: int, nodes: int) -> None:
+    broker = ProgressBroker()
+    state = {f"nodes.n{i}.progress": 0 for i in range(nodes)}
+    broker.update(state)
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tasks = [
+        asyncio.create_task(_consume(broker.stream(), events + 1))
+        for _ in range(clients)
+    ]
+    await asyncio.sleep(0.1)
+    idle = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    print(f"{len(broker):,} idle subscribers, {idle / clients:,.0f} bytes each")
+
+    start = time.perf_counter()
+    for i in range(events):
+        state[f"nodes.n{i % nodes}.progress"] = i + 1
+        broker.update(state)
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{events} deltas delivered to {clients:,} clients in {elapsed:.2f}s "
+        f"({elapsed / events * 1e3:.1f} ms per delta, "
+        f"{events * clients / elapsed:,.0f} frames/s)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=10_000)
+    parser.add_argument("--events", type=int, default=100)
+    parser.add_argument("--nodes", type=int, default=1_000)
+    args = parser.parse_args()
+    asyncio.run(run(args.clients, args.events, args.nodes))
+
+
+if __name__ == "__main__":
+    main()
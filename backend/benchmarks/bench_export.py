@@ -0,0 +1,60 @@
+"""Compare the chunked static export with the monolithic roadmap.json.
+
+Run from the backend directory::
+
+    python -m benchmarks.bench_export --nodes 5000 --changes 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_diff import mutate, synthetic_config
+from src.services.static_export import export, load_export
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=5_000)
+    parser.add_argument("--changes", type=int, default=10)
+    args = parser.parse_args()
+
+    old = synthetic_config(args.nodes)
+    new = mutate(old, args.changes)
+    monolith = json.dumps(new, indent=2).encode()
+    print(
+        f"{args.nodes:,} nodes: monolithic roadmap.json {len(monolith) / 1024:,.0f} KB "
+        f"({len(gzip.compress(monolith)) / 1024:,.0f} KB gzipped), "
+        "all invalidated by any update"
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        start = time.perf_counter()
+        first = export(old, root)
+        print(
+            f"initial export: {len(first.files)} chunks, "
+            f"{first.bytes_written / 1024:,.0f} KB with .gz/.br "
+            f"in {time.perf_counter() - start:.2f}s"
+        )
+        start = time.perf_counter()
+        second = export(new, root)
+        elapsed = time.perf_counter() - start
+        changed = sum((root / f"{name}.gz").stat().st_size for name in second.written)
+        print(
+            f"update with {args.changes} node edits: "
+            f"{len(second.written)}/{len(second.files)} chunks changed, "
+            f"{changed / 1024:,.1f} KB gzipped to refetch "
+            f"({second.bytes_written / 1024:,.1f} KB incl. compressed siblings "
+            f"and manifest) in {elapsed:.2f}s"
+        )
+        assert load_export(root) == new
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Measure what the profiling middleware costs requests it does not profile.
+
+Run from the backend directory::
+
+    python -m benchmarks.bench_profiling --requests 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+from pathlib import Path
+
+from benchmarks.bench_metrics import _endpoint, _requests
+from src.services.profiling import ProfileStore, ProfilingMiddleware, RequestProfiler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200_000)
+    args = parser.parse_args()
+    n = args.requests
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ProfileStore(Path(tmp))
+        cases = {
+            "bare": _endpoint,
+            "profiling disabled (no token)": ProfilingMiddleware(
+                _endpoint, RequestProfiler(store)
+            ),
+            "profiling enabled, not flagged": ProfilingMiddleware(
+                _endpoint, RequestProfiler(store, token="secret")
+            ),
+        }
+        bare = 0.0
+        for label, app in cases.items():
+            per_request = min(asyncio.run(_requests(app, n)) for _ in range(3)) / n
+            bare = bare or per_request
+            print(
+                f"{label:<32} {per_request * 1e6:6.2f} us "
+                f"(+{(per_request - bare) * 1e6:.2f} us)"
+            )
+
+
+if __name__ == "__main__":
+    main()
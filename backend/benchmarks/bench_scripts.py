@@ -0,0 +1,313 @@
+"""Benchmark the roadmap scripts on seeded synthetic roadmaps.
+
+Covers scripts/validate_roadmap.py (structure validation, URL extraction and
+link checking), scripts/generate_roadmap_visual.py (Mermaid generation) and
+scripts/ai/update_roadmap_progress.py (progress recomputation and export).
+Link targets and the GitHub API are served by a local HTTP stand-in, so
+runs are reproducible and offline.
+
+Each stage is run twice: once for wall time and once under tracemalloc for
+peak memory, as tracing slows execution down.
+
+Run from the backend directory::
+
+    python -m benchmarks.bench_scripts --nodes 10,1000,100000 --json out.json
+    python -m benchmarks.bench_scripts --nodes 1000000 --stages mermaid
+    python -m benchmarks.bench_scripts --compare out.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
+for path in (SCRIPTS_DIR, SCRIPTS_DIR / "ai"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+import generate_roadmap_visual  # noqa: E402
+import update_roadmap_progress  # noqa: E402
+import validate_roadmap  # noqa: E402
+from src.services.static_export import export  # noqa: E402
+
+_WORDS = (
+    "python git sql algorithms statistics pytorch transformers rag agents "
+    "evaluation mlops docker kubernetes vectors embeddings safety leadership"
+).split()
+# Link statuses served by the stand-in, weighted towards healthy links
+_STATUSES = (200,) * 16 + (301, 403, 404, 429)
+# Repositories the GitHub stand-in reports; these map to roadmap nodes
+_REPOS = ("github-profile-generator", "sql-analytics-automation", "paragon-ai")
+
+
+def synthetic_roadmap(nodes: int, link_base: str, seed: int = 0) -> dict[str, Any]:
+    """A roadmap.json-shaped document with ``nodes`` nodes over 6+ phases."""
+    rng = random.Random(seed)
+    phase_count = max(6, nodes // 20_000)
+    phases: list[dict[str, Any]] = [
+        {
+            "id": f"phase-{p}",
+            "title": f"Phase {p}",
+            "status": "not_started",
+            "progress": 0,
+            "nodes": [],
+        }
+        for p in range(1, phase_count + 1)
+    ]
+    special = ["learn-python-math", "build-github-stats", "build-paragon-ai"]
+    for n in range(nodes):
+        status = rng.choice(_STATUSES)
+        node_id = special[n] if n < len(special) else f"node-{n}"
+        phases[n * phase_count // nodes]["nodes"].append(
+            {
+                "id": node_id,
+                "title": " ".join(rng.sample(_WORDS, 3)).title(),
+                "type": rng.choice(("learn", "practice", "build")),
+                "progress": rng.randint(0, 100),
+                "resources": [
+                    {
+                        "title": f"Resource {n}",
+                        "url": f"{link_base}/status/{status}/{n}",
+                        "type": "article",
+                    }
+                ],
+            }
+        )
+    return {
+        "metadata": {
+            "title": "Synthetic Roadmap",
+            "author": "Benchmark",
+            "last_updated": "2025-06-21T00:00:00Z",
+            "version": "1.0",
+        },
+        "phases": phases,
+    }
+
+
+class _StandIn(BaseHTTPRequestHandler):
+    """Link targets under /status/<code>/ and a GitHub repos listing."""
+
+    def _reply(self, body: bool) -> None:
+        parts = self.path.strip("/").split("/")
+        if parts[0] == "users" and parts[-1] == "repos":
+            payload = json.dumps(
+                [
+                    {
+                        "name": name,
+                        "description": f"Synthetic {name}",
+                        "html_url": f"https://github.com/stand-in/{name}",
+                        "updated_at": "2025-06-21T00:00:00Z",
+                    }
+                    for name in _REPOS
+                ]
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            if body:
+                self.wfile.write(payload)
+            return
+        status = int(parts[1]) if parts[0] == "status" and parts[1:] else 404
+        if status == 301:
+            self.send_response(301)
+            self.send_header("Location", "/status/200/redirected")
+        else:
+            self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_HEAD(self) -> None:  # noqa: N802 - http.server naming
+        self._reply(body=False)
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        self._reply(body=True)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@contextmanager
+def stand_in_server() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandIn)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _check_links(urls: list[str]) -> dict[str, int]:
+    categories: dict[str, int] = {}
+    for url in urls:
+        category = validate_roadmap.validate_url(url, timeout=5)[2]
+        categories[category] = categories.get(category, 0) + 1
+    return categories
+
+
+@contextmanager
+def _chdir(path: Path) -> Iterator[None]:
+    previous = Path.cwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def _recompute_progress(data: dict[str, Any], api_base: str) -> Callable[[], Any]:
+    """Prepare an export of ``data`` and return the progress update to time."""
+    workdir = Path(tempfile.mkdtemp(prefix="bench-progress-"))
+    atexit.register(shutil.rmtree, workdir, ignore_errors=True)
+    export(data, workdir / update_roadmap_progress.DATA_DIR)
+    tracker = update_roadmap_progress.RoadmapProgressTracker()
+    tracker.api_base = api_base
+
+    def run() -> Any:
+        with _chdir(workdir), open(os.devnull, "w") as devnull:
+            stdout, sys.stdout = sys.stdout, devnull
+            try:
+                return tracker.update_roadmap_json()
+            finally:
+                sys.stdout = stdout
+
+    return run
+
+
+def _measure(prepare: Callable[[], Callable[[], Any]]) -> dict[str, Any]:
+    """Time one call of ``prepare()``, then trace a second one for peak memory."""
+    fn = prepare()
+    start = time.perf_counter()
+    fn()
+    seconds = time.perf_counter() - start
+    fn = prepare()
+    tracemalloc.start()
+    try:
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"seconds": seconds, "peak_bytes": peak}
+
+
+STAGES = ("structure", "urls", "links", "mermaid", "progress")
+
+
+def run(
+    nodes: int, stages: list[str], links: int, seed: int, base: str
+) -> list[dict[str, Any]]:
+    data = synthetic_roadmap(nodes, base, seed)
+    sample = validate_roadmap.extract_urls_from_roadmap(data)[:links]
+    # stage -> (prepare, items); prepare does untimed setup and returns the work
+    work: dict[str, tuple[Callable[[], Callable[[], Any]], int]] = {
+        "structure": (
+            lambda: partial(validate_roadmap.validate_roadmap_structure, data),
+            nodes,
+        ),
+        "urls": (
+            lambda: partial(validate_roadmap.extract_urls_from_roadmap, data),
+            nodes,
+        ),
+        "links": (lambda: partial(_check_links, sample), len(sample)),
+        "mermaid": (
+            lambda: partial(generate_roadmap_visual.generate_mermaid_graph, data),
+            nodes,
+        ),
+        # Each run rewrites the export, so every pass starts from a fresh one
+        "progress": (lambda: _recompute_progress(data, base), nodes),
+    }
+    results = []
+    for stage in stages:
+        prepare, items = work[stage]
+        result = {"nodes": nodes, "stage": stage, "items": items, **_measure(prepare)}
+        result["per_item_us"] = result["seconds"] / max(1, items) * 1e6
+        results.append(result)
+        print(
+            f"{nodes:>9,} nodes  {stage:<10} {result['seconds']:9.3f}s  "
+            f"peak {result['peak_bytes'] / 2**20:9.1f} MiB  "
+            f"{result['per_item_us']:9.2f} us/item ({items:,} items)"
+        )
+    return results
+
+
+def compare(
+    baseline: list[dict[str, Any]], current: list[dict[str, Any]], tolerance: float
+) -> list[str]:
+    """Describe every stage whose time or peak memory grew beyond ``tolerance``."""
+    previous = {(r["nodes"], r["stage"]): r for r in baseline}
+    regressions = []
+    for result in current:
+        old = previous.get((result["nodes"], result["stage"]))
+        if old is None:
+            continue
+        for metric in ("seconds", "peak_bytes"):
+            if result[metric] > old[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{result['nodes']:,} nodes {result['stage']}: {metric} "
+                    f"{old[metric]:.4g} -> {result[metric]:.4g}"
+                )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--nodes", default="10,1000,100000", help="e.g. 10,1000,1000000"
+    )
+    parser.add_argument("--stages", default=",".join(STAGES))
+    parser.add_argument("--links", type=int, default=200, help="URLs to check per size")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", type=Path, help="write results to this file")
+    parser.add_argument("--compare", type=Path, help="results file to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    stages = args.stages.split(",")
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        parser.error(f"unknown stages: {', '.join(sorted(unknown))}")
+    results: list[dict[str, Any]] = []
+    with stand_in_server() as base:
+        for nodes in (int(n) for n in args.nodes.split(",")):
+            results.extend(run(nodes, stages, args.links, args.seed, base))
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "results": results,
+    }
+    if args.json is not None:
+        args.json.write_text(json.dumps(report, indent=2) + "\n")
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text())["results"]
+        regressions = compare(baseline, results, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print(f"no regressions beyond {args.tolerance:.0%} of {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""Measure cold-start import cost of the API and the roadmap scripts.
+
+Each target is imported in a fresh interpreter under ``python -X importtime``
+several times; the median total and the slowest top-level imports of the
+median run are reported, along with whether heavy optional modules such as
+``requests`` were loaded at all.
+
+Run from the backend directory::
+
+    python -m benchmarks.bench_startup --runs 7 --json startup.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = BACKEND_DIR.parent / "scripts"
+
+# name -> (module to import, extra sys.path entries)
+TARGETS = {
+    "api": ("src.main", [BACKEND_DIR]),
+    "validate_roadmap": ("validate_roadmap", [SCRIPTS_DIR]),
+    "generate_roadmap_visual": ("generate_roadmap_visual", [SCRIPTS_DIR]),
+    "update_roadmap_progress": ("update_roadmap_progress", [SCRIPTS_DIR / "ai"]),
+}
+# Modules that should only load when a run actually needs them
+WATCHED = ("requests", "urllib3", "charset_normalizer")
+# Written to stderr just before the target import, after interpreter startup
+_MARK = "-- target --"
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int, int]]:
+    """``(module, depth, self_us, cumulative_us)`` for imports after the mark."""
+    rows = []
+    for line in stderr.partition(_MARK)[2].splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        rows.append((name.strip(), depth, int(own), int(cumulative)))
+    return rows
+
+
+def import_once(module: str, paths: list[Path]) -> list[tuple[str, int, int, int]]:
+    setup = "".join(f"sys.path.insert(0, {str(p)!r});" for p in paths)
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"import sys;{setup}sys.stderr.write({_MARK!r});import {module}",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=BACKEND_DIR,
+    )
+    return parse_importtime(result.stderr)
+
+
+def measure(name: str, runs: int, top: int) -> dict[str, Any]:
+    module, paths = TARGETS[name]
+    samples = []
+    for _ in range(runs):
+        rows = import_once(module, paths)
+        total = sum(cumulative for _, depth, _, cumulative in rows if depth == 0)
+        samples.append((total, rows))
+    samples.sort(key=lambda sample: sample[0])
+    total, rows = samples[len(samples) // 2]
+    loaded = {row[0] for row in rows}
+    # Direct imports of the target (and of its parent packages)
+    slowest = sorted((r for r in rows if r[1] == 1), key=lambda r: r[3], reverse=True)
+    return {
+        "target": name,
+        "module": module,
+        "runs": runs,
+        "median_ms": total / 1e3,
+        "min_ms": samples[0][0] / 1e3,
+        "modules": len(rows),
+        "loaded": [m for m in WATCHED if m in loaded],
+        "slowest": [
+            {"module": m, "cumulative_ms": c / 1e3} for m, _, _, c in slowest[:top]
+        ],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--targets", default=",".join(TARGETS))
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5, help="slowest imports shown")
+    parser.add_argument("--json", type=Path, help="write results to this file")
+    args = parser.parse_args()
+
+    results = []
+    for name in args.targets.split(","):
+        result = measure(name, args.runs, args.top)
+        results.append(result)
+        print(
+            f"{name:<24} median {result['median_ms']:7.1f}ms  "
+            f"min {result['min_ms']:7.1f}ms  {result['modules']:4} modules  "
+            f"loaded: {', '.join(result['loaded']) or '-'}"
+        )
+        for entry in result["slowest"]:
+            print(f"    {entry['cumulative_ms']:7.1f}ms  {entry['module']}")
+
+    if args.json is not None:
+        report = {"python": sys.version.split()[0], "results": results}
+        args.json.write_text(json.dumps(report, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
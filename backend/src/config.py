@@ -1 +1,34 @@
 # Central config (env, settings)
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+
+ROADMAP_CONFIG_PATH = Path(
+    os.getenv("ROADMAP_CONFIG_PATH", "config/roadmap-config-2025.json")
+)
+
+# Markdown catalogues indexed alongside the config by the /search endpoint
+RESOURCE_MARKDOWN_PATHS = [Path("RESOURCES.md"), Path("RESOURCE_OVERVIEW.md")]
+
+# Manifest of the chunked progress export (see services/static_export.py)
+# written by scripts/ai/update_roadmap_progress.py
+ROADMAP_PROGRESS_PATH = Path(
+    os.getenv("ROADMAP_PROGRESS_PATH", "frontend/public/data/manifest.json")
+)
+
+# How often the progress files are checked for changes to push to clients
+PROGRESS_POLL_SECONDS = float(os.getenv("PROGRESS_POLL_SECONDS", "1.0"))
+
+# Per-request profiling is off unless a token is set; requests opt in with
+# an X-Profile-Token header or ?profile=<token>, sampled at the given rate
+PROFILE_TOKEN = os.getenv("PROFILE_TOKEN") or None
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "1.0"))
+PROFILE_DIR = Path(
+    os.getenv("PROFILE_DIR", Path(tempfile.gettempdir()) / "brainwav-profiles")
+)
+PROFILE_MAX_FILES = int(os.getenv("PROFILE_MAX_FILES", "20"))
+# Profiling of one request stops after this long, or when an event stream starts
+PROFILE_MAX_SECONDS = float(os.getenv("PROFILE_MAX_SECONDS", "30"))
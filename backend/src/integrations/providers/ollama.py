@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import json
 import shutil
 from dataclasses import dataclass, field
 
-import requests
+from ...services.metrics import OLLAMA_PULL_BYTES, OLLAMA_SYNC_STAGES
 
 
 @dataclass
@@ -11,6 +12,20 @@ class RoadmapConfig:
     current_week: int
 
 
+def _pulled_bytes(body: str) -> int:
+    """Sum the final ``completed`` byte count of each layer in a pull stream."""
+    layers: dict[str, int] = {}
+    for line in body.splitlines():
+        try:
+            status = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(status, dict) and "digest" in status:
+            completed = status.get("completed", 0)
+            layers[status["digest"]] = max(layers.get(status["digest"], 0), completed)
+    return sum(layers.values())
+
+
 def _default_schedule() -> dict[int, list[str]]:
     return {
         1: ["python-tutor:latest", "codellama:7b-python"],
@@ -37,7 +52,10 @@ class OllamaIntegrationService:
         return self.schedule.get(week, ["mistral:latest"])
 
     async def pull_model(self, model_name: str) -> None:
-        requests.post(f"{self.api_base}/api/pull", json={"name": model_name})
+        import requests  # deferred: only pulls need it, and it is slow to import
+
+        response = requests.post(f"{self.api_base}/api/pull", json={"name": model_name})
+        OLLAMA_PULL_BYTES.labels(model_name).inc(_pulled_bytes(response.text))
 
     async def set_active_model(self, model_name: str) -> None:
         self.active_model = model_name
@@ -46,12 +64,16 @@ class OllamaIntegrationService:
         self.sync_status = status
 
     async def sync_with_roadmap(self) -> None:
-        if not await self.check_ollama_installed():
+        with OLLAMA_SYNC_STAGES.time("install_check"):
+            installed = await self.check_ollama_installed()
+        if not installed:
             await self.update_sync_status("error")
             return
 
         models = self.get_required_models(self.roadmap.current_week)
         for model in models:
-            await self.pull_model(model)
-        await self.set_active_model(models[0])
+            with OLLAMA_SYNC_STAGES.time("pull"):
+                await self.pull_model(model)
+        with OLLAMA_SYNC_STAGES.time("activate"):
+            await self.set_active_model(models[0])
         await self.update_sync_status("synced")
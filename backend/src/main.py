@@ -1,44 +1,333 @@
-from pathlib import Path
-from typing import Any
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager, suppress
+from datetime import date
+from typing import Annotated, Any
 
-from fastapi import FastAPI
+from fastapi import (
+    APIRouter,
+    Depends,
+    FastAPI,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.responses import FileResponse, PlainTextResponse, StreamingResponse
 
-from .integrations.providers.ollama import (
-    OllamaIntegrationService,
-    RoadmapConfig,
+from .config import (
+    PROFILE_DIR,
+    PROFILE_MAX_FILES,
+    PROFILE_MAX_SECONDS,
+    PROFILE_SAMPLE_RATE,
+    PROFILE_TOKEN,
+    PROGRESS_POLL_SECONDS,
+    RESOURCE_MARKDOWN_PATHS,
+    ROADMAP_CONFIG_PATH,
+    ROADMAP_PROGRESS_PATH,
+)
+from .services.metrics import CONTENT_TYPE, REGISTRY, MetricsMiddleware
+from .services.profiling import (
+    ProfileStore,
+    ProfilingMiddleware,
+    RequestProfiler,
+    summarize,
 )
+from .services.progress_events import ProgressBroker, progress_state
+from .services.resource_search import ResourceSearch
+from .services.response_cache import ResponseCache, negotiate_encoding
+from .services.roadmap_schedule import ScheduleIndex
 from .services.roadmap_sequence import RoadmapSequenceFixer
+from .services.roadmap_store import RoadmapStore
+from .services.roadmap_views import find_phase, phase_view, project, week_view
+from .services.static_export import assemble
 
-app = FastAPI(
-    title="brAInwav API",
-    description="AI Engineering Roadmap Backend API",
-    version="0.1.0",
+logger = logging.getLogger(__name__)
+
+roadmap_store = RoadmapStore(ROADMAP_CONFIG_PATH)
+resource_search = ResourceSearch(roadmap_store, RESOURCE_MARKDOWN_PATHS)
+progress_store = RoadmapStore(ROADMAP_PROGRESS_PATH)
+progress_broker = ProgressBroker()
+sync_state: dict[str, Any] = {}
+request_profiler = RequestProfiler(
+    ProfileStore(PROFILE_DIR, PROFILE_MAX_FILES),
+    PROFILE_TOKEN,
+    PROFILE_SAMPLE_RATE,
+    PROFILE_MAX_SECONDS,
 )
 
 
-@app.get("/")
+# Last progress state read successfully from each source file
+_last_progress: dict[str, dict[str, Any]] = {}
+
+
+def _progress(
+    source: str,
+    store: RoadmapStore,
+    load: Callable[[dict[str, Any]], dict[str, Any]],
+) -> dict[str, Any]:
+    try:
+        state = store.derived("progress", lambda data: progress_state(load(data)))
+    except (OSError, ValueError, KeyError):
+        # Missing, caught mid-write or incomplete: keep the last good state rather than
+        # sending clients a delta that unsets every key; the next check retries
+        return _last_progress.get(source, {})
+    _last_progress[source] = state
+    return state
+
+
+def publish_progress() -> None:
+    """Push any change in week, progress or sync status to event streams."""
+    # The manifest changes whenever any chunk does, so its stat is enough
+    root = progress_store.config_path.parent
+    state = {
+        **_progress("roadmap", roadmap_store, lambda config: config),
+        **_progress(
+            "export", progress_store, lambda manifest: assemble(manifest, root)
+        ),
+    }
+    state.update({f"sync.{k}": v for k, v in sync_state.items()})
+    progress_broker.update(state)
+
+
+async def _watch_progress(interval: float) -> None:
+    # One stat per file per interval, however many clients are connected
+    while True:
+        try:
+            publish_progress()
+        except Exception:
+            # A bad poll must not end the watcher; the next one retries
+            logger.exception("Publishing roadmap progress failed")
+        await asyncio.sleep(interval)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    # Build the search index up front; requests keep it in step afterwards
+    with suppress(FileNotFoundError):
+        resource_search.refresh()
+    progress_broker.closed = False
+    watcher = asyncio.create_task(_watch_progress(PROGRESS_POLL_SECONDS))
+    yield
+    progress_broker.close()
+    watcher.cancel()
+
+
+router = APIRouter()
+
+
+@router.get("/")
 async def root() -> dict[str, Any]:
     """Health check endpoint."""
     return {"message": "brAInwav API is running", "status": "healthy"}
 
 
-@app.get("/health")
+@router.get("/health")
 async def health_check() -> dict[str, Any]:
     """Health check endpoint for monitoring."""
     return {"status": "healthy", "service": "brainwav-backend"}
 
 
-@app.post("/roadmap/fix-sequence")
+@router.get("/metrics")
+async def metrics() -> Response:
+    """Prometheus metrics: route latencies, stage timings and cache counters."""
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
+
+
+def _require_profile_token(
+    x_profile_token: Annotated[str | None, Header()] = None,
+) -> None:
+    # Hidden entirely unless profiling is configured
+    if request_profiler.token is None:
+        raise HTTPException(404, "Not Found")
+    if not request_profiler.authorized(x_profile_token):
+        raise HTTPException(403, "Invalid profiling token")
+
+
+@router.get("/admin/profiles", dependencies=[Depends(_require_profile_token)])
+async def list_profiles() -> dict[str, Any]:
+    """List stored request profiles, newest first."""
+    return {"profiles": request_profiler.store.entries()}
+
+
+@router.get(
+    "/admin/profiles/{profile_id}",
+    dependencies=[Depends(_require_profile_token)],
+    response_model=None,
+)
+async def get_profile(
+    profile_id: str, format: str = "pstats"
+) -> FileResponse | PlainTextResponse:
+    """Download a profile as a pstats file, or ``format=text`` for a summary."""
+    if format not in ("pstats", "text"):
+        raise HTTPException(400, "format must be pstats or text")
+    path = request_profiler.store.path(profile_id)
+    if path is None:
+        raise HTTPException(404, f"Unknown profile: {profile_id}")
+    if format == "text":
+        return PlainTextResponse(summarize(path))
+    return FileResponse(path, media_type="application/octet-stream", filename=path.name)
+
+
+@router.post("/roadmap/fix-sequence")
 async def fix_sequence() -> dict[str, Any]:
     """Fix roadmap week ordering and update current week."""
-    fixer = RoadmapSequenceFixer(Path("config/roadmap-config-2025.json"))
-    await fixer.fix_sequence()
-    return {"status": "ok"}
+    fixer = RoadmapSequenceFixer(roadmap_store.config_path)
+    changes = await fixer.fix_sequence()
+    publish_progress()
+    return {
+        "status": "ok",
+        "changes": [{"kind": c.kind, "path": c.path} for c in changes],
+    }
+
 
+def _cached_json(request: Request, build: Callable[[], Any]) -> Response:
+    """Serve ``build()`` as JSON with a strong ETag and cached compression."""
+    cache = roadmap_store.derived("responses", lambda _: ResponseCache())
+    key = (request.url.path, tuple(sorted(request.query_params.multi_items())))
+    rendered = cache.get(key, build)
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+    body, encoding = rendered.encoded(encoding)
+    headers = {"ETag": rendered.etag(encoding), "Vary": "Accept-Encoding"}
+    if rendered.matches(request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=headers)
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(body, media_type="application/json", headers=headers)
 
-@app.post("/ollama/sync")
+
+def _fields(fields: str | None) -> list[str]:
+    return [f.strip() for f in fields.split(",")] if fields else []
+
+
+@router.get("/roadmap")
+async def get_roadmap(request: Request, fields: str | None = None) -> Response:
+    """Return the roadmap config, optionally projected to ``fields``."""
+    return _cached_json(
+        request, lambda: project(roadmap_store.config(), _fields(fields))
+    )
+
+
+@router.get("/roadmap/phases/{phase_id}")
+async def get_phase(
+    request: Request,
+    phase_id: str,
+    fields: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=500)] = 50,
+    nodes_cursor: str | None = None,
+    resources_cursor: str | None = None,
+) -> Response:
+    """Return one phase with cursor-paginated nodes and resources."""
+
+    def build() -> Any:
+        phase = find_phase(roadmap_store.config(), phase_id)
+        if phase is None:
+            raise HTTPException(404, f"Unknown phase: {phase_id}")
+        try:
+            view = phase_view(phase, limit, nodes_cursor, resources_cursor)
+        except ValueError as e:
+            raise HTTPException(400, str(e)) from e
+        return project(view, _fields(fields))
+
+    return _cached_json(request, build)
+
+
+@router.get("/roadmap/weeks/{week}")
+async def get_week(request: Request, week: int, fields: str | None = None) -> Response:
+    """Return the dates, phase, deliverables and daily plan for one week."""
+
+    def build() -> Any:
+        config = roadmap_store.config()
+        schedule = roadmap_store.derived("schedule", ScheduleIndex.from_config)
+        view = week_view(config, schedule, week)
+        if view is None:
+            raise HTTPException(404, f"Unknown week: {week}")
+        return project(view, _fields(fields))
+
+    return _cached_json(request, build)
+
+
+@router.get("/roadmap/schedule")
+async def roadmap_schedule(
+    on: Annotated[date | None, Query(alias="date")] = None,
+    start: date | None = None,
+    end: date | None = None,
+) -> dict[str, Any]:
+    """Resolve a date, or a ``start``/``end`` range, to weeks, phases and days."""
+    index = roadmap_store.derived("schedule", ScheduleIndex.from_config)
+    if start is not None or end is not None:
+        if on is not None:
+            raise HTTPException(400, "Use either date or start/end, not both")
+        if start is None or end is None:
+            raise HTTPException(400, "Range queries need both start and end")
+        if start > end:
+            raise HTTPException(400, "start must not be after end")
+        return index.lookup_range(start, end)
+    return index.lookup(on or date.today())
+
+
+@router.get("/roadmap/events")
+async def roadmap_events(request: Request) -> StreamingResponse:
+    """Server-sent events: a progress snapshot, then deltas as it changes."""
+    publish_progress()
+    return StreamingResponse(
+        progress_broker.stream(request.headers.get("last-event-id")),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/search")
+async def search_resources(
+    q: Annotated[str, Query(min_length=1)],
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    offset: Annotated[int, Query(ge=0)] = 0,
+) -> dict[str, Any]:
+    """Ranked full-text search over roadmap resources."""
+    return resource_search.search(q, limit=limit, offset=offset)
+
+
+@router.post("/ollama/sync")
 async def ollama_sync() -> dict[str, Any]:
     """Sync Ollama models with the current roadmap week."""
+    # Imported here: the provider pulls in requests, which dominates startup
+    from .integrations.providers.ollama import OllamaIntegrationService, RoadmapConfig
+
     service = OllamaIntegrationService(RoadmapConfig(current_week=1))
-    await service.sync_with_roadmap()
+    sync_state["status"] = "syncing"
+    publish_progress()
+    try:
+        await service.sync_with_roadmap()
+    except Exception:
+        await service.update_sync_status("error")
+        raise
+    finally:
+        sync_state.update(status=service.sync_status, activeModel=service.active_model)
+        publish_progress()
     return {"status": service.sync_status, "activeModel": service.active_model}
+
+
+def create_app() -> FastAPI:
+    """Build the API app around the module-level services.
+
+    The stores, search index, progress broker, sync state, response caches
+    (derived from ``roadmap_store``), metrics ``REGISTRY`` and request
+    profiler are process-global singletons: every app built here shares
+    them rather than getting its own. Run one app per process; shutting
+    any app down closes the shared broker for all of them.
+    """
+    app = FastAPI(
+        title="brAInwav API",
+        description="AI Engineering Roadmap Backend API",
+        version="0.1.0",
+        lifespan=lifespan,
+    )
+    app.include_router(router)
+    app.add_middleware(ProfilingMiddleware, profiler=request_profiler)
+    app.add_middleware(MetricsMiddleware)
+    return app
+
+
+app = create_app()
@@ -0,0 +1,255 @@
+"""Minimal in-process metrics with Prometheus text exposition.
+
+Counters and histograms keep one child per label combination, so the hot
+path is a dict lookup plus an addition (and a bisect for histograms). No
+locking is needed: the app runs its handlers on a single event loop.
+"""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+
+from .asgi import ASGIApp, Message, Receive, Scope, Send
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; spans sub-millisecond cached reads up to multi-second model pulls
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+def _labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    escaped = (
+        v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for v in values
+    )
+    return (
+        "{" + ",".join(f'{n}="{v}"' for n, v in zip(names, escaped, strict=True)) + "}"
+    )
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+@dataclass
+class CounterChild:
+    value: float = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+@dataclass
+class Counter:
+    name: str
+    help: str
+    labelnames: tuple[str, ...] = ()
+    _children: dict[tuple[str, ...], CounterChild] = field(
+        default_factory=dict, repr=False
+    )
+
+    def labels(self, *values: str) -> CounterChild:
+        child = self._children.get(values)
+        if child is None:
+            child = self._children[values] = CounterChild()
+        return child
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} counter"
+        for values, child in sorted(self._children.items()):
+            yield f"{self.name}{_labels(self.labelnames, values)} {_number(child.value)}"
+
+
+@dataclass
+class HistogramChild:
+    buckets: tuple[float, ...]
+    counts: list[int] = field(default_factory=list)
+    sum: float = 0.0
+    count: int = 0
+
+    def __post_init__(self) -> None:
+        self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        # Per-bucket counts; render() turns them into cumulative ones
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def time(self) -> _Timer:
+        return _Timer(self)
+
+
+class _Timer:
+    """Context manager observing the duration of its block."""
+
+    __slots__ = ("child", "start")
+
+    def __init__(self, child: HistogramChild) -> None:
+        self.child = child
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc: object) -> None:
+        self.child.observe(time.perf_counter() - self.start)
+
+
+@dataclass
+class Histogram:
+    name: str
+    help: str
+    labelnames: tuple[str, ...] = ()
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    _children: dict[tuple[str, ...], HistogramChild] = field(
+        default_factory=dict, repr=False
+    )
+
+    def labels(self, *values: str) -> HistogramChild:
+        child = self._children.get(values)
+        if child is None:
+            child = self._children[values] = HistogramChild(self.buckets)
+        return child
+
+    def time(self, *values: str) -> _Timer:
+        return _Timer(self.labels(*values))
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} histogram"
+        names = (*self.labelnames, "le")
+        for values, child in sorted(self._children.items()):
+            total = 0
+            for bound, count in zip(
+                (*self.buckets, float("inf")), child.counts, strict=True
+            ):
+                total += count
+                labels = _labels(names, (*values, _number(bound)))
+                yield f"{self.name}_bucket{labels} {total}"
+            labels = _labels(self.labelnames, values)
+            yield f"{self.name}_sum{labels} {_number(child.sum)}"
+            yield f"{self.name}_count{labels} {child.count}"
+
+
+@dataclass
+class Registry:
+    metrics: list[Counter | Histogram] = field(default_factory=list)
+
+    def counter(
+        self, name: str, help: str, labelnames: tuple[str, ...] = ()
+    ) -> Counter:
+        metric = Counter(name, help, labelnames)
+        self.metrics.append(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        metric = Histogram(name, help, labelnames, buckets)
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        return "\n".join(line for m in self.metrics for line in m.render()) + "\n"
+
+
+REGISTRY = Registry()
+
+REQUEST_LATENCY = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "Time from request to response headers, by route template.",
+    ("method", "route", "status"),
+)
+FIX_SEQUENCE_STAGES = REGISTRY.histogram(
+    "roadmap_fix_sequence_stage_seconds",
+    "Duration of each stage of RoadmapSequenceFixer.fix_sequence.",
+    ("stage",),
+)
+OLLAMA_SYNC_STAGES = REGISTRY.histogram(
+    "ollama_sync_stage_seconds",
+    "Duration of each stage of OllamaIntegrationService.sync_with_roadmap.",
+    ("stage",),
+)
+OLLAMA_PULL_BYTES = REGISTRY.counter(
+    "ollama_pull_bytes_total",
+    "Model bytes reported as downloaded by Ollama pulls.",
+    ("model",),
+)
+CACHE_REQUESTS = REGISTRY.counter(
+    "cache_requests_total",
+    "Lookups in in-process caches, by cache and hit or miss.",
+    ("cache", "result"),
+)
+
+
+class MetricsMiddleware:
+    """Plain ASGI middleware recording request latency per route template.
+
+    Latency is measured to the response headers, so long-lived streams such
+    as server-sent events are not counted as slow requests. Unmatched paths
+    share one label to keep cardinality bounded.
+    """
+
+    def __init__(self, app: ASGIApp, histogram: Histogram = REQUEST_LATENCY) -> None:
+        self.app = app
+        self.histogram = histogram
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = time.perf_counter()
+        histogram = self.histogram
+        started = False
+
+        def observe(status: int) -> None:
+            route = scope.get("route")
+            histogram.labels(
+                scope["method"], getattr(route, "path", "<unmatched>"), str(status)
+            ).observe(time.perf_counter() - start)
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal started
+            if message["type"] == "http.response.start":
+                started = True
+                observe(message["status"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        except Exception:
+            # Unhandled errors become a 500 further out; count them here
+            if not started:
+                observe(500)
+            raise
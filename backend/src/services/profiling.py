@@ -0,0 +1,187 @@
+"""Opt-in cProfile capture of individual requests.
+
+A request is profiled when it carries the profiling token, either as an
+``X-Profile-Token`` header or a ``profile`` query parameter, and passes the
+sample rate. Profiles are written in ``pstats`` format to a directory that
+keeps only the newest ``max_files``.
+
+cProfile follows the thread, not the coroutine, so a profile also contains
+whatever other requests ran on the event loop while it was awaited. Only one
+request is profiled at a time, so profiling stops when an event stream
+starts or after ``max_seconds``, whichever comes first; a long-lived
+response cannot hold the slot.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import hmac
+import io
+import os
+import pstats
+import random
+import re
+import time
+from dataclasses import dataclass, field
+from itertools import count
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qsl
+
+from .asgi import ASGIApp, Message, Receive, Scope, Send
+
+TOKEN_HEADER = b"x-profile-token"
+TOKEN_PARAM = "profile"
+_SUFFIX = ".prof"
+_PROFILE_ID = re.compile(r"^[0-9]+-[0-9]+-[A-Za-z0-9_.-]+$")
+_UNSAFE = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+@dataclass
+class ProfileStore:
+    """Ring buffer of profile files in one directory."""
+
+    directory: Path
+    max_files: int = 20
+    _seq: count[int] = field(default_factory=count, repr=False)
+
+    def new_id(self, method: str, path: str) -> str:
+        name = _UNSAFE.sub("_", f"{method}{path}").strip("_")[:80]
+        return f"{time.time_ns() // 1_000_000}-{next(self._seq)}-{name}"
+
+    def save(self, profile_id: str, profile: cProfile.Profile) -> Path:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        target = self.directory / f"{profile_id}{_SUFFIX}"
+        tmp = target.with_name(target.name + ".tmp")
+        profile.dump_stats(tmp)
+        os.replace(tmp, target)
+        for stale in self._files()[: -self.max_files or None]:
+            stale.unlink(missing_ok=True)
+        return target
+
+    def _files(self) -> list[Path]:
+        if not self.directory.is_dir():
+            return []
+        # Stray files that do not look like our profiles are ignored
+        files = [
+            p
+            for p in self.directory.glob(f"*{_SUFFIX}")
+            if _PROFILE_ID.match(p.name.removesuffix(_SUFFIX))
+        ]
+        return sorted(files, key=lambda p: tuple(map(int, p.name.split("-", 2)[:2])))
+
+    def entries(self) -> list[dict[str, Any]]:
+        """Stored profiles, newest first."""
+        return [
+            {"id": p.name.removesuffix(_SUFFIX), "size": p.stat().st_size}
+            for p in reversed(self._files())
+        ]
+
+    def path(self, profile_id: str) -> Path | None:
+        if not _PROFILE_ID.match(profile_id):
+            return None
+        target = self.directory / f"{profile_id}{_SUFFIX}"
+        return target if target.is_file() else None
+
+
+def summarize(path: Path, limit: int = 50) -> str:
+    """Render the top functions of a stored profile by cumulative time."""
+    out = io.StringIO()
+    stats = pstats.Stats(str(path), stream=out)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+    return out.getvalue()
+
+
+@dataclass
+class RequestProfiler:
+    """Decide which requests to profile and where profiles go.
+
+    With no ``token`` configured, profiling is disabled entirely.
+    """
+
+    store: ProfileStore
+    token: str | None = None
+    sample_rate: float = 1.0
+    max_seconds: float = 30.0
+    active: bool = False
+
+    def authorized(self, token: str | None) -> bool:
+        if self.token is None or token is None:
+            return False
+        return hmac.compare_digest(token.encode(), self.token.encode())
+
+    def wants(self, scope: Scope) -> bool:
+        token = None
+        for name, value in scope["headers"]:
+            if name == TOKEN_HEADER:
+                token = value.decode("latin-1")
+                break
+        else:
+            query = scope.get("query_string", b"")
+            if TOKEN_PARAM.encode() in query:
+                token = dict(parse_qsl(query.decode("latin-1"))).get(TOKEN_PARAM)
+        if not self.authorized(token) or self.active:
+            return False
+        return random.random() < self.sample_rate
+
+
+def _is_event_stream(headers: list[tuple[bytes, bytes]]) -> bool:
+    return any(
+        name.lower() == b"content-type" and value.startswith(b"text/event-stream")
+        for name, value in headers
+    )
+
+
+class ProfilingMiddleware:
+    """Plain ASGI middleware running flagged requests under cProfile.
+
+    Profiled responses carry an ``X-Profile-Id`` header naming the stored
+    profile. Other requests pass straight through.
+    """
+
+    def __init__(self, app: ASGIApp, profiler: RequestProfiler) -> None:
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        profiler = self.profiler
+        if (
+            profiler.token is None
+            or scope["type"] != "http"
+            or not profiler.wants(scope)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = profiler.store.new_id(scope["method"], scope["path"])
+        profile = cProfile.Profile()
+        deadline = time.monotonic() + profiler.max_seconds
+
+        done = False
+
+        def finish() -> None:
+            nonlocal done
+            if not done:
+                done = True
+                profile.disable()
+                profiler.active = False
+                profiler.store.save(profile_id, profile)
+
+        async def send_with_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-profile-id", profile_id.encode()))
+                message = {**message, "headers": headers}
+                if _is_event_stream(headers):
+                    # Streams run until the client leaves; keep only the setup
+                    finish()
+            elif time.monotonic() > deadline:
+                finish()
+            await send(message)
+
+        profiler.active = True
+        profile.enable()
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            finish()
@@ -0,0 +1,199 @@
+"""In-process pub/sub of roadmap progress for server-sent events.
+
+Progress is kept as a flat mapping such as ``{"currentWeek": 3,
+"nodes.git-basics.progress": 50, "sync.status": "synced"}`` so that a change
+is published as a small delta of the keys that moved. Each event is encoded
+once and the same bytes are handed to every subscriber.
+
+Subscribers have bounded queues. One that falls behind has its backlog
+dropped and is sent a fresh snapshot instead, so a slow client never holds
+memory or blocks publishers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections import deque
+from collections.abc import AsyncIterator, Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+# Events queued per subscriber before it is resynced with a snapshot
+DEFAULT_MAX_PENDING = 64
+# Comment lines keep idle connections open through proxies
+HEARTBEAT_SECONDS = 15.0
+
+_PROGRESS_FIELDS = ("progress", "status")
+
+
+def _phases(data: Mapping[str, Any]) -> Iterable[tuple[str, dict[str, Any]]]:
+    phases = data.get("phases", {})
+    if isinstance(phases, dict):
+        phases = [{"id": k, **v} for k, v in phases.items() if isinstance(v, dict)]
+    for phase in phases if isinstance(phases, list) else []:
+        if isinstance(phase, dict) and "id" in phase:
+            yield str(phase["id"]), phase
+
+
+def progress_state(data: Mapping[str, Any] | None) -> dict[str, Any]:
+    """Flatten the current week and phase/node progress of ``data``.
+
+    Works on both the roadmap config and the progress data written by
+    ``update_roadmap_progress.py``.
+    """
+    state: dict[str, Any] = {}
+    if not data:
+        return state
+    current = data.get("currentWeek")
+    if isinstance(current, dict):
+        current = current.get("weekNumber")
+    if current is not None:
+        state["currentWeek"] = current
+    for phase_id, phase in _phases(data):
+        for name in _PROGRESS_FIELDS:
+            if name in phase:
+                state[f"phases.{phase_id}.{name}"] = phase[name]
+        for node in phase.get("nodes", []):
+            if isinstance(node, dict) and "id" in node:
+                for name in _PROGRESS_FIELDS:
+                    if name in node:
+                        state[f"nodes.{node['id']}.{name}"] = node[name]
+    return state
+
+
+def _frame(event: str, seq: int, data: Any) -> bytes:
+    payload = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    return f"id: {seq}\nevent: {event}\ndata: {payload}\n\n".encode()
+
+
+@dataclass(eq=False)
+class Subscriber:
+    """A bounded queue of encoded events for one connection."""
+
+    max_pending: int = DEFAULT_MAX_PENDING
+    stale: bool = False
+    heartbeat_due: bool = False
+    _pending: deque[bytes] = field(default_factory=deque, repr=False)
+    _ready: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    def push(self, frame: bytes) -> None:
+        if self.stale:
+            return
+        if len(self._pending) >= self.max_pending:
+            # Too far behind: drop the backlog and resync from a snapshot
+            self._pending.clear()
+            self.stale = True
+        else:
+            self._pending.append(frame)
+        self._ready.set()
+
+    def wake(self, heartbeat: bool = False) -> None:
+        self.heartbeat_due |= heartbeat
+        self._ready.set()
+
+    def drain(self) -> list[bytes]:
+        frames = list(self._pending)
+        self._pending.clear()
+        self._ready.clear()
+        return frames
+
+    async def wait(self) -> None:
+        await self._ready.wait()
+
+
+@dataclass
+class ProgressBroker:
+    """Fan progress deltas out to any number of subscribers."""
+
+    max_pending: int = DEFAULT_MAX_PENDING
+    heartbeat: float = HEARTBEAT_SECONDS
+    seq: int = 0
+    closed: bool = False
+    _state: dict[str, Any] = field(default_factory=dict, repr=False)
+    _snapshot: bytes | None = field(default=None, repr=False)
+    _subscribers: set[Subscriber] = field(default_factory=set, repr=False)
+    _timer: asyncio.TimerHandle | None = field(default=None, repr=False)
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    @property
+    def state(self) -> dict[str, Any]:
+        return dict(self._state)
+
+    def update(self, state: Mapping[str, Any]) -> dict[str, Any] | None:
+        """Replace the whole state; publishes and returns the delta, if any."""
+        missing = object()
+        changed = {k: v for k, v in state.items() if self._state.get(k, missing) != v}
+        removed = [k for k in self._state if k not in state]
+        if not changed and not removed:
+            return None
+        self._state.update(changed)
+        for key in removed:
+            del self._state[key]
+        self.seq += 1
+        self._snapshot = None
+        delta: dict[str, Any] = {"set": changed}
+        if removed:
+            delta["unset"] = removed
+        frame = _frame("delta", self.seq, delta)
+        for subscriber in self._subscribers:
+            subscriber.push(frame)
+        return delta
+
+    def snapshot_frame(self) -> bytes:
+        if self._snapshot is None:
+            self._snapshot = _frame("snapshot", self.seq, self._state)
+        return self._snapshot
+
+    def subscribe(self) -> Subscriber:
+        subscriber = Subscriber(self.max_pending)
+        self._subscribers.add(subscriber)
+        if self._timer is None:
+            loop = asyncio.get_running_loop()
+            self._timer = loop.call_later(self.heartbeat, self._tick)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        self._subscribers.discard(subscriber)
+        if not self._subscribers and self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _tick(self) -> None:
+        # One timer for all connections rather than a timeout per connection
+        for subscriber in self._subscribers:
+            subscriber.wake(heartbeat=True)
+        loop = asyncio.get_running_loop()
+        self._timer = loop.call_later(self.heartbeat, self._tick)
+
+    def close(self) -> None:
+        """End every stream, e.g. on shutdown so workers can exit promptly."""
+        self.closed = True
+        for subscriber in self._subscribers:
+            subscriber.wake()
+
+    async def stream(self, last_event_id: str | None = None) -> AsyncIterator[bytes]:
+        """Yield SSE frames: a snapshot (unless the client is current), then deltas.
+
+        Idle connections cost one small subscriber and a sleeping coroutine;
+        nothing is polled or timed per connection.
+        """
+        subscriber = self.subscribe()
+        try:
+            if last_event_id != str(self.seq):
+                yield self.snapshot_frame()
+            while not self.closed:
+                await subscriber.wait()
+                frames = subscriber.drain()
+                if subscriber.stale:
+                    subscriber.stale = False
+                    frames = [self.snapshot_frame()]
+                if subscriber.heartbeat_due and not frames and not self.closed:
+                    frames = [b": keepalive\n\n"]
+                subscriber.heartbeat_due = False
+                for frame in frames:
+                    yield frame
+        finally:
+            self.unsubscribe(subscriber)
@@ -0,0 +1,424 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import re
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from heapq import heappush, heapreplace, nlargest
+from pathlib import Path
+from typing import Any
+
+from .metrics import CACHE_REQUESTS
+from .roadmap_store import RoadmapStore
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOP_WORDS = frozenset(
+    {"a", "an", "and", "for", "in", "of", "on", "the", "to", "with"}
+)
+
+# Relative weight of a term depending on the field it appears in
+FIELD_WEIGHTS = {
+    "title": 3.0,
+    "type": 2.0,
+    "phase": 2.0,
+    "description": 1.0,
+    "url": 1.0,
+}
+
+# Keys used as a resource's display title, in order of preference
+_TITLE_KEYS = (
+    "title",
+    "name",
+    "platform",
+    "channel",
+    "newsletter",
+    "community",
+    "model",
+)
+_URL_KEYS = ("link", "url")
+
+# Multi-term matches up to this size are scored exhaustively
+_DIRECT_SCORE_LIMIT = 4096
+# Multi-term result pages kept until the index next changes
+_RESULT_CACHE_SIZE = 4096
+_SEARCH_HIT = CACHE_REQUESTS.labels("search", "hit")
+_SEARCH_MISS = CACHE_REQUESTS.labels("search", "miss")
+
+
+def tokenize(text: str) -> list[str]:
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in _STOP_WORDS]
+
+
+@dataclass(frozen=True)
+class Resource:
+    """A searchable learning resource."""
+
+    id: str
+    title: str
+    type: str = ""
+    phase: str = ""
+    description: str = ""
+    url: str = ""
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "title": self.title,
+            "type": self.type,
+            "phase": self.phase,
+            "description": self.description,
+            "url": self.url,
+        }
+
+    def digest(self) -> str:
+        payload = json.dumps(self.to_dict(), sort_keys=True).encode()
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def term_weights(self) -> dict[str, float]:
+        weights: dict[str, float] = {}
+        for name, weight in FIELD_WEIGHTS.items():
+            for term in tokenize(getattr(self, name)):
+                weights[term] = weights.get(term, 0.0) + weight
+        return weights
+
+
+def _resource_from_dict(
+    path: str, obj: dict[str, Any], kind: str, phase: str
+) -> Resource | None:
+    url = next((obj[k] for k in _URL_KEYS if isinstance(obj.get(k), str)), "")
+    title = next((obj[k] for k in _TITLE_KEYS if isinstance(obj.get(k), str)), "")
+    if not url or not title:
+        return None
+    description = " ".join(
+        v
+        for k, v in obj.items()
+        if isinstance(v, str) and k not in _TITLE_KEYS + _URL_KEYS + ("phase", "type")
+    )
+    return Resource(
+        id=path,
+        title=title,
+        type=str(obj.get("type", kind)),
+        phase=str(obj.get("phase", phase)),
+        description=description,
+        url=url,
+    )
+
+
+def extract_config_resources(config: dict[str, Any]) -> Iterator[Resource]:
+    """Yield every linked resource, plus the plain-text lists under phases."""
+
+    def walk(obj: Any, path: str, kind: str, phase: str) -> Iterator[Resource]:
+        if isinstance(obj, dict):
+            resource = _resource_from_dict(path, obj, kind, phase)
+            if resource is not None:
+                yield resource
+                return
+            for key, value in obj.items():
+                child_phase = phase
+                if path == "config:$.phases" and isinstance(value, dict):
+                    child_phase = str(value.get("id", key))
+                yield from walk(value, f"{path}.{key}", key, child_phase)
+        elif isinstance(obj, list):
+            for i, item in enumerate(obj):
+                item_path = f"{path}[{i}]"
+                if isinstance(item, str) and ".resources." in path:
+                    yield Resource(id=item_path, title=item, type=kind, phase=phase)
+                else:
+                    yield from walk(item, item_path, kind, phase)
+
+    yield from walk(config, "config:$", "", "")
+
+
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*)$")
+_TABLE_SEP_RE = re.compile(r"^\|[\s:|-]+\|$")
+_BOLD_ITEM_RE = re.compile(r"^\s*(?:[-*]|\d+\.)\s+\*\*\"?(.+?)\"?\*\*\s*(.*)$")
+_LINK_RE = re.compile(r"\[([^\]]+)\]\((https?://[^)\s]+)\)")
+
+
+def extract_markdown_resources(name: str, text: str) -> Iterator[Resource]:
+    """Yield resources from markdown tables, bold list items and links."""
+    section = ""
+    header: list[str] | None = None
+    for lineno, raw in enumerate(text.splitlines(), 1):
+        line = raw.strip()
+        rid = f"{name}:{lineno}"
+        heading = _HEADING_RE.match(line)
+        if heading:
+            section = heading.group(2)
+            header = None
+            continue
+        phase = section if section.lower().startswith("phase") else ""
+        if line.startswith("|"):
+            cells = [c.strip() for c in line.strip("|").split("|")]
+            if header is None:
+                header = cells
+            elif not _TABLE_SEP_RE.match(line) and cells and cells[0]:
+                kind = header[0].lower() if header else ""
+                link = _LINK_RE.search(cells[0])
+                yield Resource(
+                    id=rid,
+                    title=link.group(1) if link else cells[0],
+                    type=kind,
+                    phase=phase,
+                    description=" ".join(cells[1:]),
+                    url=link.group(2) if link else "",
+                )
+            continue
+        header = None
+        item = _BOLD_ITEM_RE.match(raw)
+        if item:
+            link = _LINK_RE.search(raw)
+            yield Resource(
+                id=rid,
+                title=item.group(1),
+                type=section.lower(),
+                phase=phase,
+                description=item.group(2),
+                url=link.group(2) if link else "",
+            )
+            continue
+        for match in _LINK_RE.finditer(line):
+            yield Resource(
+                id=f"{rid}:{match.start()}",
+                title=match.group(1),
+                type=section.lower(),
+                phase=phase,
+                url=match.group(2),
+            )
+
+
+@dataclass
+class InvertedIndex:
+    """Term -> posting map with field-weighted TF-IDF ranking."""
+
+    docs: dict[int, Resource] = field(default_factory=dict)
+    postings: dict[str, dict[int, float]] = field(default_factory=dict)
+    _ids: dict[str, int] = field(default_factory=dict, repr=False)
+    _digests: dict[str, str] = field(default_factory=dict, repr=False)
+    _terms: dict[int, tuple[str, ...]] = field(default_factory=dict, repr=False)
+    _ranked: dict[str, list[int]] = field(default_factory=dict, repr=False)
+    # Terms whose ranked list is missing or stale
+    _unranked: set[str] = field(default_factory=set, repr=False)
+    _results: OrderedDict[
+        tuple[tuple[str, ...], int], tuple[int, list[tuple[float, int]]]
+    ] = field(default_factory=OrderedDict, repr=False)
+    _next: int = field(default=0, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def add(self, resource: Resource) -> None:
+        self.remove(resource.id)
+        doc = self._next
+        self._next += 1
+        self._ids[resource.id] = doc
+        self._results.clear()
+        self._digests[resource.id] = resource.digest()
+        self.docs[doc] = resource
+        weights = resource.term_weights()
+        self._terms[doc] = tuple(weights)
+        for term, weight in weights.items():
+            self.postings.setdefault(term, {})[doc] = weight
+            self._ranked.pop(term, None)
+            self._unranked.add(term)
+
+    def remove(self, resource_id: str) -> None:
+        doc = self._ids.pop(resource_id, None)
+        if doc is None:
+            return
+        del self._digests[resource_id]
+        self._results.clear()
+        del self.docs[doc]
+        for term in self._terms.pop(doc):
+            posting = self.postings[term]
+            del posting[doc]
+            if not posting:
+                del self.postings[term]
+            self._ranked.pop(term, None)
+            self._unranked.add(term)
+
+    def _idf(self, term: str) -> float:
+        return math.log(1 + len(self.docs) / len(self.postings[term]))
+
+    def _ranked_list(self, term: str) -> list[int]:
+        ranked = self._ranked.get(term)
+        if ranked is None:
+            posting = self.postings[term]
+            # Postings are in doc order and the sort is stable, so ties
+            # stay in ascending doc order
+            ranked = sorted(posting, key=posting.__getitem__, reverse=True)
+            self._ranked[term] = ranked
+            self._unranked.discard(term)
+        return ranked
+
+    def rank(self) -> None:
+        """Sort the posting lists changed since the last call.
+
+        Done after a batch of changes so queries never pay for sorting a
+        large posting list on first use.
+        """
+        for term in self._unranked & self.postings.keys():
+            self._ranked_list(term)
+        self._unranked.clear()
+
+    def search(
+        self, query: str, limit: int = 20, offset: int = 0
+    ) -> tuple[int, list[tuple[Resource, float]]]:
+        """Return ``(total, page)`` for docs containing every query term."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or any(t not in self.postings for t in terms):
+            return 0, []
+
+        if len(terms) == 1:
+            term = terms[0]
+            idf = self._idf(term)
+            posting = self.postings[term]
+            page = self._ranked_list(term)[offset : offset + limit]
+            return len(posting), [(self.docs[d], posting[d] * idf) for d in page]
+
+        key = (tuple(sorted(terms)), offset + limit)
+        cached = self._results.get(key)
+        if cached is None:
+            _SEARCH_MISS.inc()
+            cached = self._search_all(terms, offset + limit)
+            self._results[key] = cached
+            if len(self._results) > _RESULT_CACHE_SIZE:
+                self._results.popitem(last=False)
+        else:
+            _SEARCH_HIT.inc()
+            self._results.move_to_end(key)
+        total, top = cached
+        return total, [(self.docs[-d], s) for s, d in top[offset:]]
+
+    def _search_all(
+        self, terms: list[str], wanted: int
+    ) -> tuple[int, list[tuple[float, int]]]:
+        # Intersect in C via key views, smallest posting first
+        postings = sorted((self.postings[t] for t in terms), key=len)
+        common = postings[0].keys() & postings[1].keys()
+        for posting in postings[2:]:
+            # view & set walks the smaller side; set &= view walks the view
+            common = posting.keys() & common
+        if not common:
+            return 0, []
+
+        idfs = [(self.postings[t], self._idf(t)) for t in terms]
+
+        def score(doc: int) -> float:
+            return sum(posting[doc] * idf for posting, idf in idfs)
+
+        if len(common) <= _DIRECT_SCORE_LIMIT:
+            top = nlargest(wanted, ((score(d), -d) for d in common))
+        else:
+            top = self._threshold_top(terms, idfs, common, wanted, score)
+        return len(common), top
+
+    def _threshold_top(
+        self,
+        terms: list[str],
+        idfs: list[tuple[dict[int, float], float]],
+        common: set[int],
+        wanted: int,
+        score: Callable[[int], float],
+    ) -> list[tuple[float, int]]:
+        """Fagin's threshold algorithm over the per-term ranked lists.
+
+        Walks every term's list in weight order and stops as soon as the
+        best possible score of any unseen doc cannot beat the current top.
+        """
+        ranked = [self._ranked_list(t) for t in terms]
+        heap: list[tuple[float, int]] = []
+        seen: set[int] = set()
+        for depth in range(max(len(r) for r in ranked)):
+            threshold = 0.0
+            for (posting, idf), docs in zip(idfs, ranked, strict=True):
+                if depth >= len(docs):
+                    continue
+                doc = docs[depth]
+                threshold += posting[doc] * idf
+                if doc in seen or doc not in common:
+                    continue
+                seen.add(doc)
+                entry = (score(doc), -doc)
+                if len(heap) < wanted:
+                    heappush(heap, entry)
+                elif entry > heap[0]:
+                    heapreplace(heap, entry)
+            if len(heap) >= wanted and heap[0][0] >= threshold:
+                break
+        return sorted(heap, reverse=True)
+
+    def sync(self, prefix: str, resources: Iterable[Resource]) -> int:
+        """Make the docs whose id starts with ``prefix`` match ``resources``.
+
+        Unchanged resources are left in place; returns the number of changes.
+        """
+        current = {r.id: r for r in resources}
+        changed = {
+            rid
+            for rid in self._ids
+            if rid.startswith(prefix)
+            and (rid not in current or self._digests[rid] != current[rid].digest())
+        }
+        for rid in changed:
+            self.remove(rid)
+        for rid, resource in current.items():
+            if rid not in self._ids:
+                self.add(resource)
+                changed.add(rid)
+        self.rank()
+        return len(changed)
+
+
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+@dataclass
+class ResourceSearch:
+    """Keep an :class:`InvertedIndex` in step with the config and markdown files."""
+
+    store: RoadmapStore
+    markdown_paths: list[Path] = field(default_factory=list)
+    index: InvertedIndex = field(default_factory=InvertedIndex)
+    _config_version: int = field(default=-1, repr=False)
+    _stamps: dict[Path, tuple[int, int] | None] = field(
+        default_factory=dict, repr=False
+    )
+
+    def refresh(self) -> None:
+        config = self.store.config()
+        if self.store.version != self._config_version:
+            self.index.sync("config:", extract_config_resources(config))
+            self._config_version = self.store.version
+        for path in self.markdown_paths:
+            stamp = _file_stamp(path)
+            if path in self._stamps and self._stamps[path] == stamp:
+                continue
+            text = path.read_text(encoding="utf-8") if stamp else ""
+            self.index.sync(
+                f"{path.name}:", extract_markdown_resources(path.name, text)
+            )
+            self._stamps[path] = stamp
+
+    def search(self, query: str, limit: int = 20, offset: int = 0) -> dict[str, Any]:
+        self.refresh()
+        total, page = self.index.search(query, limit=limit, offset=offset)
+        return {
+            "query": query,
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+            "results": [
+                {**resource.to_dict(), "score": round(score, 4)}
+                for resource, score in page
+            ],
+        }
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any
+
+from .metrics import CACHE_REQUESTS
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+# Bodies smaller than this are not worth the compression overhead
+MIN_COMPRESS_SIZE = 512
+
+_HIT = CACHE_REQUESTS.labels("responses", "hit")
+_MISS = CACHE_REQUESTS.labels("responses", "miss")
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        assert brotli is not None
+        return bytes(brotli.compress(body, quality=5))
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=6, mtime=0)
+    return body
+
+
+def supported_encodings() -> tuple[str, ...]:
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: str | None) -> str:
+    """Pick the best content-coding the client accepts (``identity`` if none)."""
+    if not accept_encoding:
+        return "identity"
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip().lower()] = q
+    for encoding in supported_encodings():
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return "identity"
+
+
+@dataclass
+class RenderedResponse:
+    """A serialized JSON body, its ETag and lazily compressed variants."""
+
+    body: bytes
+    digest: str
+    _encoded: dict[str, bytes] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_data(cls, data: Any) -> RenderedResponse:
+        body = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+        digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+        return cls(body=body, digest=digest)
+
+    def etag(self, encoding: str = "identity") -> str:
+        # Each content-coding is a distinct representation with its own tag
+        if encoding == "identity":
+            return f'"{self.digest}"'
+        return f'"{self.digest}-{encoding}"'
+
+    def encoded(self, encoding: str) -> tuple[bytes, str]:
+        """Return ``(body, encoding)``, compressing at most once per encoding."""
+        if encoding == "identity" or len(self.body) < MIN_COMPRESS_SIZE:
+            return self.body, "identity"
+        if encoding not in self._encoded:
+            self._encoded[encoding] = _compress(self.body, encoding)
+        return self._encoded[encoding], encoding
+
+    def matches(self, if_none_match: str | None) -> bool:
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        # If-None-Match uses weak comparison, so a W/ prefix is ignored
+        return any(
+            tag.strip().removeprefix("W/").strip('"').split("-")[0] == self.digest
+            for tag in if_none_match.split(",")
+        )
+
+
+@dataclass
+class ResponseCache:
+    """LRU of rendered responses for one config version."""
+
+    max_entries: int = 256
+    _entries: OrderedDict[Hashable, RenderedResponse] = field(
+        default_factory=OrderedDict, repr=False
+    )
+
+    def get(self, key: Hashable, build: Callable[[], Any]) -> RenderedResponse:
+        rendered = self._entries.get(key)
+        if rendered is not None:
+            _HIT.inc()
+            self._entries.move_to_end(key)
+            return rendered
+        _MISS.inc()
+        rendered = RenderedResponse.from_data(build())
+        self._entries[key] = rendered
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return rendered
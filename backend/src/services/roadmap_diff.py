@@ -0,0 +1,335 @@
+"""Structural diff of roadmap configs using per-subtree content hashes.
+
+Every dict, list and scalar in a config gets a Merkle digest, so identical
+subtrees (metadata, a phase, a week, a node) are skipped with a single
+comparison and the cost of a diff grows with the size of the change rather
+than the size of the config.
+
+Usage::
+
+    python -m src.services.roadmap_diff old.json new.json [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from bisect import bisect_left
+from dataclasses import asdict, dataclass, field
+from hashlib import blake2b
+from pathlib import Path
+from typing import Any, NamedTuple
+
+_DIGEST_SIZE = 16
+_CONTAINERS = (dict, list)
+
+
+class MerkleNode(NamedTuple):
+    """A dict or list with the digest of its whole subtree.
+
+    Scalar children are kept as plain values; only containers are hashed.
+    """
+
+    digest: bytes
+    value: Any
+    children: dict[str, Any] | list[Any]
+
+
+@dataclass(frozen=True)
+class Change:
+    """One structural difference.
+
+    ``kind`` is added, removed, modified, moved or reordered. A reordered
+    dict key stays at ``path``; ``old`` and ``new`` are its key positions.
+    """
+
+    kind: str
+    path: str
+    old: Any = None
+    new: Any = None
+    from_path: str | None = None
+    digest: Any = field(default=None, repr=False, compare=False)
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        del data["digest"]
+        return {k: v for k, v in data.items() if v is not None}
+
+
+def build_tree(value: Any, reuse: MerkleNode | None = None) -> MerkleNode:
+    """Hash ``value`` bottom-up. Dict key order is significant.
+
+    Digests are bytes and scalars keep their type in ``repr()``, so the
+    serialized parts of two containers only match when their contents do.
+
+    With ``reuse``, subtrees that are the very same objects as in that
+    earlier tree keep their node without being rehashed. This suits
+    copy-on-write edits; it is only correct if shared containers were not
+    mutated in place since ``reuse`` was built.
+    """
+    if reuse is not None and reuse.value is value:
+        return reuse
+    prior = reuse.children if reuse is not None else None
+    if isinstance(value, dict):
+        fields: dict[str, Any] = {}
+        parts: list[Any] = []
+        for key, item in value.items():
+            key = str(key)
+            if isinstance(item, _CONTAINERS):
+                old = prior.get(key) if isinstance(prior, dict) else None
+                item = build_tree(item, old if isinstance(old, MerkleNode) else None)
+                parts.append((key, item.digest))
+            else:
+                parts.append((key, item))
+            fields[key] = item
+        return MerkleNode(_digest(b"D" + repr(parts).encode()), value, fields)
+    if isinstance(value, list):
+        items: list[Any] = []
+        parts = []
+        olds = prior if isinstance(prior, list) else []
+        for i, item in enumerate(value):
+            if isinstance(item, _CONTAINERS):
+                old = olds[i] if i < len(olds) else None
+                item = build_tree(item, old if isinstance(old, MerkleNode) else None)
+                parts.append(item.digest)
+            else:
+                parts.append(item)
+            items.append(item)
+        return MerkleNode(_digest(b"A" + repr(parts).encode()), value, items)
+    return MerkleNode(_digest(b"S" + repr(value).encode()), value, [])
+
+
+def _digest(data: bytes) -> bytes:
+    return blake2b(data, digest_size=_DIGEST_SIZE).digest()
+
+
+def _value(child: Any) -> Any:
+    return child.value if isinstance(child, MerkleNode) else child
+
+
+def _same(old: Any, new: Any) -> bool:
+    if isinstance(old, MerkleNode) and isinstance(new, MerkleNode):
+        return bool(old.digest == new.digest)
+    return type(old) is type(new) and old == new
+
+
+def _added(path: str, child: Any) -> Change:
+    return Change("added", path, new=_value(child), digest=_content_key(child))
+
+
+def _removed(path: str, child: Any) -> Change:
+    return Change("removed", path, old=_value(child), digest=_content_key(child))
+
+
+def _content_key(child: Any) -> Any:
+    if isinstance(child, MerkleNode):
+        return child.digest
+    return (type(child).__name__, child)
+
+
+def _join(path: str, key: str) -> str:
+    return f"{path}.{key}" if path else key
+
+
+def _item_id(item: Any) -> Any:
+    if isinstance(item, MerkleNode) and isinstance(item.value, dict):
+        return item.value.get("id")
+    return None
+
+
+def _list_keys(items: list[Any]) -> list[Any] | None:
+    """Identity keys for list items: ``id`` fields when every item has one."""
+    ids = [_item_id(n) for n in items]
+    if all(i is not None for i in ids) and len(set(map(repr, ids))) == len(ids):
+        return [("id", repr(i)) for i in ids]
+    return None
+
+
+def _diff(old: Any, new: Any, path: str, out: list[Change]) -> None:
+    if _same(old, new):
+        return
+    if isinstance(old, MerkleNode) and isinstance(new, MerkleNode):
+        if isinstance(old.children, dict) and isinstance(new.children, dict):
+            _diff_dict(old.children, new.children, path, out)
+            return
+        if isinstance(old.value, list) and isinstance(new.value, list):
+            assert isinstance(old.children, list) and isinstance(new.children, list)
+            _diff_list(old.children, new.children, path, out)
+            return
+    out.append(Change("modified", path, _value(old), _value(new)))
+
+
+def _diff_dict(
+    old: dict[str, Any],
+    new: dict[str, Any],
+    path: str,
+    out: list[Change],
+) -> None:
+    for key, node in old.items():
+        if key not in new:
+            out.append(_removed(_join(path, key), node))
+    old_pos = {k: i for i, k in enumerate(k for k in old if k in new)}
+    stable = _longest_increasing([old_pos[k] for k in new if k in old_pos])
+    old_index = {k: i for i, k in enumerate(old)}
+    for i, (key, node) in enumerate(new.items()):
+        child = _join(path, key)
+        if key not in old:
+            out.append(_added(child, node))
+            continue
+        if old_pos[key] not in stable:
+            out.append(Change("reordered", child, old_index[key], i))
+        _diff(old[key], node, child, out)
+
+
+def _diff_list(old: list[Any], new: list[Any], path: str, out: list[Change]) -> None:
+    if len(old) == len(new):
+        # Common case: items edited in place, nothing added, removed or moved
+        changed = [
+            i for i, (a, b) in enumerate(zip(old, new, strict=True)) if not _same(a, b)
+        ]
+        if all(
+            _item_id(old[i]) is not None and _item_id(old[i]) == _item_id(new[i])
+            for i in changed
+        ):
+            for i in changed:
+                _diff(old[i], new[i], f"{path}[{i}]", out)
+            return
+
+    old_keys = _list_keys(old)
+    new_keys = _list_keys(new)
+    by_content = old_keys is None or new_keys is None
+    if old_keys is None or new_keys is None:
+        old_keys = [_content_key(n) for n in old]
+        new_keys = [_content_key(n) for n in new]
+
+    # Pair items by id (or by content); when matching by content, leftovers
+    # at the same index are treated as in-place modifications
+    positions: dict[Any, list[int]] = {}
+    for i, key in enumerate(old_keys):
+        positions.setdefault(key, []).append(i)
+    matched: dict[int, int] = {}
+    for j, key in enumerate(new_keys):
+        candidates = positions.get(key)
+        if candidates:
+            matched[j] = candidates.pop(0)
+    used = set(matched.values())
+    for j in range(len(new) if by_content else 0):
+        if j not in matched and j < len(old) and j not in used:
+            matched[j] = j
+            used.add(j)
+
+    for i, node in enumerate(old):
+        if i not in used:
+            out.append(_removed(f"{path}[{i}]", node))
+    order = [matched[j] for j in range(len(new)) if j in matched]
+    stable = _longest_increasing(order)
+    for j, node in enumerate(new):
+        child = f"{path}[{j}]"
+        if j not in matched:
+            out.append(_added(child, node))
+            continue
+        i = matched[j]
+        if i not in stable:
+            out.append(Change("moved", child, from_path=f"{path}[{i}]"))
+        _diff(old[i], node, child, out)
+
+
+def _longest_increasing(seq: list[int]) -> set[int]:
+    """Values of one longest increasing subsequence (patience sorting)."""
+    tails: list[int] = []
+    tail_idx: list[int] = []
+    prev = [-1] * len(seq)
+    for i, v in enumerate(seq):
+        k = bisect_left(tails, v)
+        if k == len(tails):
+            tails.append(v)
+            tail_idx.append(i)
+        else:
+            tails[k] = v
+            tail_idx[k] = i
+        prev[i] = tail_idx[k - 1] if k else -1
+    result = set()
+    i = tail_idx[-1] if tail_idx else -1
+    while i >= 0:
+        result.add(seq[i])
+        i = prev[i]
+    return result
+
+
+def _pair_moves(changes: list[Change]) -> list[Change]:
+    """Collapse a removed and an added container with equal digests into a move."""
+    removed: dict[Any, list[Change]] = {}
+    for change in changes:
+        if change.kind == "removed" and isinstance(change.old, dict | list):
+            removed.setdefault(change.digest, []).append(change)
+    if not removed:
+        return changes
+    moved_from: set[int] = set()
+    result: list[Change] = []
+    for change in changes:
+        candidates = removed.get(change.digest)
+        if change.kind == "added" and candidates:
+            source = candidates.pop(0)
+            moved_from.add(id(source))
+            result.append(Change("moved", change.path, from_path=source.path))
+        else:
+            result.append(change)
+    return [c for c in result if id(c) not in moved_from]
+
+
+def diff_trees(old: MerkleNode, new: MerkleNode) -> list[Change]:
+    changes: list[Change] = []
+    _diff(old, new, "", changes)
+    return _pair_moves(changes)
+
+
+def diff_configs(old: Any, new: Any) -> list[Change]:
+    """Return the structural changes needed to turn ``old`` into ``new``."""
+    return diff_trees(build_tree(old), build_tree(new))
+
+
+_SYMBOLS = {
+    "added": "+",
+    "removed": "-",
+    "modified": "~",
+    "moved": ">",
+    "reordered": "^",
+}
+
+
+def format_change(change: Change) -> str:
+    symbol = _SYMBOLS[change.kind]
+    if change.kind == "moved":
+        return f"{symbol} {change.from_path} -> {change.path}"
+    if change.kind == "reordered":
+        return f"{symbol} {change.path}: position {change.old} -> {change.new}"
+    if change.kind == "modified":
+        return f"{symbol} {change.path}: {change.old!r} -> {change.new!r}"
+    return f"{symbol} {change.path}"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Diff two roadmap config files.")
+    parser.add_argument("old", type=Path)
+    parser.add_argument("new", type=Path)
+    parser.add_argument("--json", action="store_true", help="emit JSON changes")
+    args = parser.parse_args(argv)
+
+    with args.old.open(encoding="utf-8") as f:
+        old = json.load(f)
+    with args.new.open(encoding="utf-8") as f:
+        new = json.load(f)
+    changes = diff_configs(old, new)
+
+    if args.json:
+        json.dump([c.to_dict() for c in changes], sys.stdout, indent=2)
+        print()
+    else:
+        for change in changes:
+            print(format_change(change))
+    return 1 if changes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any
+
+
+@dataclass(frozen=True)
+class Interval:
+    """A closed date range ``[start, end]`` carrying a schedule entry."""
+
+    start: date
+    end: date
+    value: dict[str, Any]
+
+
+@dataclass
+class IntervalIndex:
+    """Sorted, non-overlapping intervals with O(log n) point and range lookups."""
+
+    intervals: list[Interval]
+    _starts: list[date] = field(init=False, repr=False)
+    _ends: list[date] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.intervals = sorted(self.intervals, key=lambda iv: iv.start)
+        # Drop intervals that overlap an earlier one so that ends stay sorted
+        kept: list[Interval] = []
+        for iv in self.intervals:
+            if iv.end < iv.start:
+                continue
+            if kept and iv.start <= kept[-1].end:
+                continue
+            kept.append(iv)
+        self.intervals = kept
+        self._starts = [iv.start for iv in kept]
+        self._ends = [iv.end for iv in kept]
+
+    def at(self, day: date) -> dict[str, Any] | None:
+        i = bisect_right(self._starts, day) - 1
+        if i >= 0 and day <= self._ends[i]:
+            return self.intervals[i].value
+        return None
+
+    def overlapping(self, start: date, end: date) -> list[dict[str, Any]]:
+        i = bisect_left(self._ends, start)
+        j = bisect_right(self._starts, end)
+        return [iv.value for iv in self.intervals[i:j]]
+
+
+def _parse_date(value: Any) -> date | None:
+    if not isinstance(value, str):
+        return None
+    try:
+        return date.fromisoformat(value[:10])
+    except ValueError:
+        return None
+
+
+def _week_intervals(config: dict[str, Any]) -> list[Interval]:
+    metadata = config.get("metadata", {})
+    start = _parse_date(metadata.get("startDate"))
+    total = metadata.get("totalWeeks")
+    if start is None or not isinstance(total, int):
+        return []
+    intervals = []
+    for n in range(1, total + 1):
+        week_start = start + timedelta(weeks=n - 1)
+        week_end = week_start + timedelta(days=6)
+        intervals.append(
+            Interval(
+                week_start,
+                week_end,
+                {
+                    "weekNumber": n,
+                    "startDate": week_start.isoformat(),
+                    "endDate": week_end.isoformat(),
+                },
+            )
+        )
+    return intervals
+
+
+def _phase_intervals(config: dict[str, Any]) -> list[Interval]:
+    phases = config.get("phases", {})
+    items = phases.values() if isinstance(phases, dict) else phases
+    intervals = []
+    for phase in items:
+        if not isinstance(phase, dict):
+            continue
+        start = _parse_date(phase.get("startDate"))
+        end = _parse_date(phase.get("endDate"))
+        if start is None or end is None:
+            continue
+        summary = {k: v for k, v in phase.items() if not isinstance(v, dict | list)}
+        intervals.append(Interval(start, end, summary))
+    return intervals
+
+
+def _day_intervals(config: dict[str, Any]) -> list[Interval]:
+    current = config.get("currentWeek")
+    if not isinstance(current, dict):
+        return []
+    intervals = []
+    for weekday, entry in current.get("dailySchedule", {}).items():
+        if not isinstance(entry, dict):
+            continue
+        day = _parse_date(entry.get("date"))
+        if day is None:
+            continue
+        intervals.append(Interval(day, day, {"day": weekday, **entry}))
+    return intervals
+
+
+@dataclass
+class ScheduleIndex:
+    """Date lookups over the weeks, phases and daily schedule of a config."""
+
+    weeks: IntervalIndex
+    phases: IntervalIndex
+    days: IntervalIndex
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> ScheduleIndex:
+        return cls(
+            weeks=IntervalIndex(_week_intervals(config)),
+            phases=IntervalIndex(_phase_intervals(config)),
+            days=IntervalIndex(_day_intervals(config)),
+        )
+
+    @property
+    def start_date(self) -> date | None:
+        return self.weeks.intervals[0].start if self.weeks.intervals else None
+
+    def lookup(self, day: date) -> dict[str, Any]:
+        return {
+            "date": day.isoformat(),
+            "week": self.weeks.at(day),
+            "phase": self.phases.at(day),
+            "day": self.days.at(day),
+        }
+
+    def lookup_range(self, start: date, end: date) -> dict[str, Any]:
+        return {
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "weeks": self.weeks.overlapping(start, end),
+            "phases": self.phases.overlapping(start, end),
+            "days": self.days.overlapping(start, end),
+        }
@@ -7,6 +7,12 @@ from datetime import date
 from pathlib import Path
 from typing import Any, cast
 
+from .metrics import FIX_SEQUENCE_STAGES
+from .roadmap_diff import Change, build_tree, diff_trees
+
+# Used when a config does not declare ``metadata.startDate``
+DEFAULT_START_DATE = date(2025, 6, 21)
+
 
 def _load_json(path: Path) -> dict[str, Any]:
     with path.open("r", encoding="utf-8") as f:
@@ -18,6 +24,37 @@ def _save_json(path: Path, data: dict[str, Any]) -> None:
         json.dump(data, f, indent=2)
 
 
+def _start_date(config: dict[str, Any]) -> date | None:
+    start = config.get("metadata", {}).get("startDate")
+    try:
+        return date.fromisoformat(start) if isinstance(start, str) else None
+    except ValueError:
+        return None
+
+
+def _current_week(config: dict[str, Any], week: int) -> Any:
+    """``config["currentWeek"]`` moved to ``week``, kept within the roadmap."""
+    total = config.get("metadata", {}).get("totalWeeks")
+    if isinstance(total, int) and total > 0:
+        week = min(week, total)
+    week = max(week, 1)
+    current = config.get("currentWeek")
+    # The full config keeps its schedule next to the number; keep it intact
+    if isinstance(current, dict):
+        return {**current, "weekNumber": week}
+    return week
+
+
+def _changes(config: dict[str, Any], fixed: dict[str, Any]) -> list[Change]:
+    # Only the phase order and the current week can differ; checking them
+    # first avoids hashing a large config when there is nothing to fix
+    same_order = list(fixed["phases"]) == list(config.get("phases", {}))
+    if same_order and fixed["currentWeek"] == config.get("currentWeek"):
+        return []
+    before = build_tree(config)
+    return diff_trees(before, build_tree(fixed, reuse=before))
+
+
 @dataclass
 class RoadmapSequenceFixer:
     """Utility to ensure roadmap weeks follow the correct order."""
@@ -35,17 +72,32 @@ class RoadmapSequenceFixer:
         # Sort phases by their declared order key
         return dict(sorted(phases.items(), key=lambda kv: kv[1].get("order", 0)))
 
-    def calculate_current_week(self) -> int:
-        start = date(2025, 6, 21)
+    def calculate_current_week(self, start: date | None = None) -> int:
+        start = start or DEFAULT_START_DATE
         delta = date.today() - start
         return delta.days // 7 + 1
 
     async def save_config(self, config: dict[str, Any]) -> None:
         _save_json(self.config_path, config)
 
-    async def fix_sequence(self) -> None:
-        await self.backup_current_progress()
-        config = await self.load_config()
-        config["phases"] = self.reorder_phases(config.get("phases", {}))
-        config["currentWeek"] = self.calculate_current_week()
-        await self.save_config(config)
+    async def fix_sequence(self) -> list[Change]:
+        """Reorder phases and refresh the current week.
+
+        The file is backed up and rewritten only when something changed.
+        """
+        with FIX_SEQUENCE_STAGES.time("load"):
+            config = await self.load_config()
+        with FIX_SEQUENCE_STAGES.time("reorder"):
+            fixed = dict(config)
+            fixed["phases"] = self.reorder_phases(config.get("phases", {}))
+            fixed["currentWeek"] = _current_week(
+                config, self.calculate_current_week(_start_date(config))
+            )
+        with FIX_SEQUENCE_STAGES.time("diff"):
+            changes = _changes(config, fixed)
+        if changes:
+            with FIX_SEQUENCE_STAGES.time("backup"):
+                await self.backup_current_progress()
+            with FIX_SEQUENCE_STAGES.time("save"):
+                await self.save_config(fixed)
+        return changes
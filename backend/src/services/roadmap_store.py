@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar, cast
+
+from .metrics import CACHE_REQUESTS
+
+T = TypeVar("T")
+
+_HIT = CACHE_REQUESTS.labels("config", "hit")
+_MISS = CACHE_REQUESTS.labels("config", "miss")
+
+
+def _stamp(path: Path) -> tuple[int, int, int]:
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+@dataclass
+class RoadmapStore:
+    """Cache the roadmap config and values derived from it.
+
+    The file is re-read only when its stat signature changes; derived values
+    (indexes, encoded payloads) are dropped at the same time so they are
+    rebuilt lazily from the new config.
+    """
+
+    config_path: Path
+    version: int = 0
+    _config: dict[str, Any] | None = field(default=None, repr=False)
+    _stamp: tuple[int, int, int] | None = field(default=None, repr=False)
+    _derived: dict[str, Any] = field(default_factory=dict, repr=False)
+
+    def refresh(self) -> bool:
+        """Reload the config if the file changed. Returns True on reload."""
+        stamp = _stamp(self.config_path)
+        if self._config is not None and stamp == self._stamp:
+            _HIT.inc()
+            return False
+        _MISS.inc()
+        with self.config_path.open("r", encoding="utf-8") as f:
+            self._config = cast(dict[str, Any], json.load(f))
+        self._stamp = stamp
+        self._derived.clear()
+        self.version += 1
+        return True
+
+    def config(self) -> dict[str, Any]:
+        self.refresh()
+        assert self._config is not None
+        return self._config
+
+    def derived(self, key: str, builder: Callable[[dict[str, Any]], T]) -> T:
+        """Return ``builder(config)``, computed once per config version."""
+        config = self.config()
+        if key not in self._derived:
+            self._derived[key] = builder(config)
+        return cast(T, self._derived[key])
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import re
+from collections.abc import Iterable
+from typing import Any
+
+from .roadmap_schedule import ScheduleIndex
+
+_MISSING = object()
+
+
+def project(data: Any, fields: Iterable[str]) -> Any:
+    """Keep only the dotted ``fields`` of ``data``.
+
+    Lists are projected element-wise and ``*`` matches every key of a dict,
+    so ``phases.*.title`` selects phase titles. Unknown paths are ignored.
+    """
+    paths = [f.split(".") for f in fields if f]
+    if not paths:
+        return data
+    result: Any = _MISSING
+    for path in paths:
+        result = _merge(result, _pick(data, path))
+    return {} if result is _MISSING else result
+
+
+def _pick(data: Any, path: list[str]) -> Any:
+    if not path:
+        return data
+    if isinstance(data, list):
+        picked = [_pick(item, path) for item in data]
+        return [p for p in picked if p is not _MISSING]
+    if isinstance(data, dict):
+        head, rest = path[0], path[1:]
+        if head == "*":
+            matched = {k: _pick(v, rest) for k, v in data.items()}
+            return {k: v for k, v in matched.items() if v is not _MISSING}
+        if head in data:
+            value = _pick(data[head], rest)
+            return _MISSING if value is _MISSING else {head: value}
+    return _MISSING
+
+
+def _merge(left: Any, right: Any) -> Any:
+    if left is _MISSING:
+        return right
+    if right is _MISSING:
+        return left
+    if isinstance(left, dict) and isinstance(right, dict):
+        merged = dict(left)
+        for key, value in right.items():
+            merged[key] = _merge(merged.get(key, _MISSING), value)
+        return merged
+    if isinstance(left, list) and isinstance(right, list) and len(left) == len(right):
+        return [_merge(a, b) for a, b in zip(left, right, strict=True)]
+    return right
+
+
+def encode_cursor(offset: int) -> str:
+    return base64.urlsafe_b64encode(f"o:{offset}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str | None) -> int:
+    """Return the offset for ``cursor``; raises ``ValueError`` if malformed."""
+    if not cursor:
+        return 0
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    prefix, _, offset = raw.partition(":")
+    if prefix != "o" or not offset.isdigit():
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return int(offset)
+
+
+def paginate(
+    items: list[Any], cursor: str | None, limit: int
+) -> tuple[list[Any], dict[str, Any]]:
+    offset = decode_cursor(cursor)
+    page = items[offset : offset + limit]
+    end = offset + len(page)
+    return page, {
+        "total": len(items),
+        "nextCursor": encode_cursor(end) if end < len(items) else None,
+    }
+
+
+def find_phase(config: dict[str, Any], phase_id: str) -> dict[str, Any] | None:
+    phases = config.get("phases", {})
+    if isinstance(phases, dict):
+        phase = phases.get(phase_id)
+        if isinstance(phase, dict):
+            return phase
+        phases = list(phases.values())
+    for phase in phases:
+        if isinstance(phase, dict) and phase.get("id") == phase_id:
+            return phase
+    return None
+
+
+def phase_resources(phase: dict[str, Any]) -> list[dict[str, Any]]:
+    """Flatten a phase's resources into one list tagged by category."""
+    resources = phase.get("resources", [])
+    if isinstance(resources, list):
+        return [r if isinstance(r, dict) else {"title": r} for r in resources]
+    flat = []
+    for category, items in resources.items():
+        for item in items if isinstance(items, list) else [items]:
+            entry = item if isinstance(item, dict) else {"title": item}
+            flat.append({"category": category, **entry})
+    return flat
+
+
+def phase_view(
+    phase: dict[str, Any],
+    limit: int,
+    nodes_cursor: str | None = None,
+    resources_cursor: str | None = None,
+) -> dict[str, Any]:
+    """Return a phase with its nodes and resources cursor-paginated."""
+    nodes, nodes_page = paginate(phase.get("nodes", []), nodes_cursor, limit)
+    resources, resources_page = paginate(
+        phase_resources(phase), resources_cursor, limit
+    )
+    view = {k: v for k, v in phase.items() if k not in ("nodes", "resources")}
+    view["nodes"] = nodes
+    view["resources"] = resources
+    view["page"] = {"nodes": nodes_page, "resources": resources_page}
+    return view
+
+
+def week_view(
+    config: dict[str, Any], schedule: ScheduleIndex, week: int
+) -> dict[str, Any] | None:
+    """Return the dates, phase, deliverables and daily plan for ``week``."""
+    if not 1 <= week <= len(schedule.weeks.intervals):
+        return None
+    interval = schedule.weeks.intervals[week - 1]
+    phase = schedule.phases.at(interval.start)
+    pattern = re.compile(rf"\(Week {week}\)")
+    deliverables: list[str] = []
+    if phase is not None:
+        full = find_phase(config, str(phase.get("id"))) or {}
+        deliverables = [
+            d
+            for d in full.get("keyDeliverables", [])
+            if isinstance(d, str) and pattern.search(d)
+        ]
+    current = config.get("currentWeek")
+    daily: dict[str, Any] | None = None
+    if isinstance(current, dict) and current.get("weekNumber") == week:
+        daily = current.get("dailySchedule")
+    return {
+        **interval.value,
+        "phase": phase,
+        "deliverables": deliverables,
+        "dailySchedule": daily,
+    }
@@ -0,0 +1,230 @@
+"""Chunked, content-hashed static export of roadmap data.
+
+The roadmap is split into a small ``manifest.json`` plus one chunk per phase,
+one per week and one for everything else, each named after a hash of its
+contents (``phases/phase-1.3f9a0c12d4e5.json``). Chunks can be cached
+forever; an update rewrites the manifest and only the chunks whose content
+changed. Every file gets precompressed ``.gz`` and, when ``brotli`` is
+installed, ``.br`` siblings.
+
+Layout of the manifest::
+
+    {
+      "format": 1,
+      "metadata": {...},
+      "core": "core.<hash>.json",
+      "currentWeek": "weeks/current.<hash>.json",
+      "phasesForm": "list" | "dict",
+      "phases": [{"id": ..., "chunk": ..., "weeks": [...]}]
+    }
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from hashlib import blake2b
+from pathlib import Path
+from typing import Any
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+_HASH_SIZE = 6
+# Keys kept in the manifest itself; "metadata" changes on every update
+_MANIFEST_KEYS = ("metadata",)
+_SLUG = re.compile(r"[^A-Za-z0-9_-]+")
+_CHUNK = re.compile(rf"\.[0-9a-f]{{{_HASH_SIZE * 2}}}\.json$")
+# Brotli's top quality costs ~30x quality 9 for ~15% smaller output, which
+# only pays off for small chunks; large ones dominated export time
+_BROTLI_MAX_QUALITY_BYTES = 64 * 1024
+# Files written for each chunk: the plain JSON and its compressed siblings
+_SUFFIXES = ("", ".gz", ".br") if brotli is not None else ("", ".gz")
+
+
+@dataclass
+class ExportResult:
+    """Files referenced by a manifest and how many bytes were written."""
+
+    manifest: dict[str, Any]
+    files: list[str] = field(default_factory=list)
+    written: list[str] = field(default_factory=list)
+    bytes_written: int = 0
+    removed: list[str] = field(default_factory=list)
+
+
+def _slug(value: Any) -> str:
+    return _SLUG.sub("-", str(value)).strip("-") or "item"
+
+
+def _encode(data: Any) -> bytes:
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def _encoders(body: bytes) -> dict[str, Callable[[bytes], bytes]]:
+    """Suffix -> encoder for each file written per chunk, plain file last."""
+    encoders: dict[str, Callable[[bytes], bytes]] = {
+        ".gz": lambda b: gzip.compress(b, 9, mtime=0)
+    }
+    if brotli is not None:
+        quality = 11 if len(body) <= _BROTLI_MAX_QUALITY_BYTES else 9
+        encoders[".br"] = lambda b: bytes(brotli.compress(b, quality=quality))
+    encoders[""] = lambda b: b
+    return encoders
+
+
+def _write(path: Path, body: bytes, missing_only: bool = False) -> int:
+    """Write ``body`` and its compressed siblings atomically.
+
+    The plain file goes last, so a run interrupted part-way leaves it absent.
+    With ``missing_only``, only files that do not exist yet are written.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    written = 0
+    for suffix, encode in _encoders(body).items():
+        target = path.with_name(path.name + suffix)
+        if missing_only and target.exists():
+            continue
+        data = encode(body)
+        tmp = target.with_name(target.name + ".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, target)
+        written += len(data)
+    return written
+
+
+def _phase_items(data: dict[str, Any]) -> tuple[str, list[tuple[str, Any]]]:
+    phases = data.get("phases", [])
+    if isinstance(phases, dict):
+        return "dict", list(phases.items())
+    return "list", [(str(p.get("id", i)), p) for i, p in enumerate(phases)]
+
+
+def split(data: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Split ``data`` into ``(manifest, {chunk name: chunk data})``."""
+    chunks: dict[str, Any] = {}
+
+    def add(prefix: str, value: Any) -> str:
+        digest = blake2b(_encode(value), digest_size=_HASH_SIZE).hexdigest()
+        name = f"{prefix}.{digest}.json"
+        chunks[name] = value
+        return name
+
+    form, phases = _phase_items(data)
+    manifest: dict[str, Any] = {"format": FORMAT_VERSION, "phasesForm": form}
+    for key in _MANIFEST_KEYS:
+        if key in data:
+            manifest[key] = data[key]
+    rest = {
+        k: v
+        for k, v in data.items()
+        if k not in _MANIFEST_KEYS and k not in ("phases", "currentWeek")
+    }
+    manifest["core"] = add("core", rest)
+    if "currentWeek" in data:
+        manifest["currentWeek"] = add("weeks/current", data["currentWeek"])
+
+    entries = []
+    for key, phase in phases:
+        entry: dict[str, Any] = {"id": key}
+        body = phase
+        weeks = phase.get("weeks") if isinstance(phase, dict) else None
+        if isinstance(weeks, list) and all(isinstance(w, dict) for w in weeks):
+            body = {k: v for k, v in phase.items() if k != "weeks"}
+            entry["weeks"] = [
+                add(f"weeks/week-{_slug(w.get('weekNumber', i))}", w)
+                for i, w in enumerate(weeks)
+            ]
+        entry["chunk"] = add(f"phases/{_slug(key)}", body)
+        entries.append(entry)
+    manifest["phases"] = entries
+    return manifest, chunks
+
+
+def assemble(manifest: dict[str, Any], root: Path) -> dict[str, Any]:
+    """Rebuild the full roadmap from ``manifest`` and the chunks under ``root``."""
+
+    def load(name: str) -> Any:
+        with (root / name).open(encoding="utf-8") as f:
+            return json.load(f)
+
+    data: dict[str, Any] = {k: manifest[k] for k in _MANIFEST_KEYS if k in manifest}
+    data.update(load(manifest["core"]))
+    if "currentWeek" in manifest:
+        data["currentWeek"] = load(manifest["currentWeek"])
+    phases = []
+    for entry in manifest["phases"]:
+        phase = load(entry["chunk"])
+        if "weeks" in entry:
+            phase = {**phase, "weeks": [load(name) for name in entry["weeks"]]}
+        phases.append((entry["id"], phase))
+    if manifest.get("phasesForm") == "dict":
+        data["phases"] = dict(phases)
+    else:
+        data["phases"] = [phase for _, phase in phases]
+    return data
+
+
+def load_export(root: Path) -> dict[str, Any] | None:
+    """Return the exported roadmap under ``root``, or None if there is none."""
+    try:
+        with (root / MANIFEST_NAME).open(encoding="utf-8") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return None
+    return assemble(manifest, root)
+
+
+def _referenced(manifest: dict[str, Any]) -> set[str]:
+    names = {manifest["core"]}
+    if "currentWeek" in manifest:
+        names.add(manifest["currentWeek"])
+    for entry in manifest["phases"]:
+        names.add(entry["chunk"])
+        names.update(entry.get("weeks", []))
+    return names
+
+
+def export(data: dict[str, Any], root: Path) -> ExportResult:
+    """Write ``data`` as a chunked export under ``root``.
+
+    Chunks that already exist are left untouched. Chunks referenced by
+    neither the new nor the previous manifest are deleted, so clients still
+    holding the previous manifest can finish loading.
+    """
+    manifest, chunks = split(data)
+    result = ExportResult(manifest=manifest, files=sorted(chunks))
+    previous: set[str] = set()
+    try:
+        with (root / MANIFEST_NAME).open(encoding="utf-8") as f:
+            previous = _referenced(json.load(f))
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        pass
+
+    for name, chunk in chunks.items():
+        path = root / name
+        # Existing chunks are immutable; only fill in any missing siblings
+        siblings = [path.with_name(path.name + suffix) for suffix in _SUFFIXES]
+        if all(sibling.exists() for sibling in siblings):
+            continue
+        result.bytes_written += _write(path, _encode(chunk), missing_only=True)
+        result.written.append(name)
+    result.bytes_written += _write(root / MANIFEST_NAME, _encode(manifest))
+
+    keep = previous | set(chunks)
+    for path in sorted(root.rglob("*.json")):
+        name = path.relative_to(root).as_posix()
+        if name in keep or not _CHUNK.search(name):
+            continue
+        for suffix in ("", ".gz", ".br"):
+            path.with_name(path.name + suffix).unlink(missing_ok=True)
+        result.removed.append(name)
+    return result
@@ -1,5 +1,6 @@
 """Test configuration and fixtures."""
 
+import json
 import sys
 from pathlib import Path
 
@@ -10,9 +11,68 @@ from fastapi.testclient import TestClient
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
 from src.main import app
+from src.services.progress_events import ProgressBroker
+from src.services.resource_search import ResourceSearch
+from src.services.roadmap_store import RoadmapStore
+
+SAMPLE_CONFIG = {
+    "metadata": {
+        "title": "Test Roadmap",
+        "startDate": "2025-06-21",
+        "totalWeeks": 4,
+    },
+    "currentWeek": {
+        "weekNumber": 1,
+        "dailySchedule": {
+            "monday": {"date": "2025-06-23", "morning": "Python basics"},
+            "tuesday": {"date": "2025-06-24", "morning": "Git workflows"},
+        },
+    },
+    "phases": {
+        "phase1": {
+            "id": "phase1",
+            "title": "Foundations",
+            "startDate": "2025-06-21",
+            "endDate": "2025-07-04",
+            "resources": {"books": ["Python Crash Course"]},
+        },
+        "phase2": {
+            "id": "phase2",
+            "title": "Machine Learning",
+            "startDate": "2025-07-05",
+            "endDate": "2025-07-18",
+        },
+    },
+    "essentialBooks": {
+        "coreLibrary": [
+            {
+                "title": "Grokking Algorithms",
+                "author": "Aditya Bhargava",
+                "phase": "Phase 1",
+                "link": "https://www.manning.com/books/grokking-algorithms",
+            }
+        ]
+    },
+}
 
 
 @pytest.fixture
 def client():
     """Test client fixture."""
     return TestClient(app)
+
+
+@pytest.fixture
+def roadmap_config(tmp_path, monkeypatch) -> Path:
+    """Point the app at a small roadmap config in a temporary directory."""
+    config_file = tmp_path / "roadmap-config.json"
+    config_file.write_text(json.dumps(SAMPLE_CONFIG))
+    store = RoadmapStore(config_file)
+    monkeypatch.setattr("src.main.roadmap_store", store)
+    monkeypatch.setattr("src.main.resource_search", ResourceSearch(store))
+    progress = RoadmapStore(tmp_path / "data" / "manifest.json")
+    monkeypatch.setattr("src.main.progress_store", progress)
+    monkeypatch.setattr("src.main.progress_broker", ProgressBroker())
+    monkeypatch.setattr("src.main.sync_state", {})
+    monkeypatch.setattr("src.main._last_progress", {})
+    return config_file
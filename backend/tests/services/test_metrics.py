@@ -0,0 +1,51 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.services.metrics import Histogram, MetricsMiddleware, Registry
+
+
+def test_counter_renders_labels():
+    registry = Registry()
+    counter = registry.counter("hits_total", "Hits.", ("cache",))
+    counter.labels("search").inc()
+    counter.labels("search").inc(2)
+    counter.labels('we"ird').inc()
+    text = registry.render()
+    assert "# TYPE hits_total counter" in text
+    assert 'hits_total{cache="search"} 3' in text
+    assert 'hits_total{cache="we\\"ird"} 1' in text
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = Registry()
+    histogram = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    child = histogram.labels()
+    for value in (0.05, 0.1, 0.5, 5.0):
+        child.observe(value)
+    lines = registry.render().splitlines()
+    assert 'latency_seconds_bucket{le="0.1"} 2' in lines
+    assert 'latency_seconds_bucket{le="1"} 3' in lines
+    assert 'latency_seconds_bucket{le="+Inf"} 4' in lines
+    assert "latency_seconds_sum 5.65" in lines
+    assert "latency_seconds_count 4" in lines
+
+
+def test_histogram_time_observes_block():
+    registry = Registry()
+    histogram = registry.histogram("stage_seconds", "Stages.", ("stage",))
+    with histogram.time("load"):
+        pass
+    assert histogram.labels("load").count == 1
+
+
+def test_middleware_counts_unhandled_errors_as_500():
+    app = FastAPI()
+
+    @app.get("/boom")
+    async def boom() -> None:
+        raise RuntimeError("boom")
+
+    histogram = Histogram("latency", "test", ("method", "route", "status"))
+    app.add_middleware(MetricsMiddleware, histogram=histogram)
+    client = TestClient(app, raise_server_exceptions=False)
+    assert client.get("/boom").status_code == 500
+    assert histogram.labels("GET", "/boom", "500").count == 1
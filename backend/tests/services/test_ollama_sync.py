@@ -3,7 +3,9 @@ import pytest
 from src.integrations.providers.ollama import (
     OllamaIntegrationService,
     RoadmapConfig,
+    _pulled_bytes,
 )
+from src.services.metrics import OLLAMA_SYNC_STAGES
 
 
 @pytest.mark.asyncio
@@ -45,3 +47,35 @@ async def test_sync_success(monkeypatch):
     await service.sync_with_roadmap()
     assert service.sync_status == "synced"
     assert service.active_model == "python-tutor:latest"
+
+
+def test_pulled_bytes_sums_final_layer_sizes():
+    body = "\n".join(
+        [
+            '{"status": "pulling manifest"}',
+            '{"status": "pulling a", "digest": "sha256:a", "total": 10, "completed": 4}',
+            '{"status": "pulling a", "digest": "sha256:a", "total": 10, "completed": 10}',
+            '{"status": "pulling b", "digest": "sha256:b", "total": 5, "completed": 5}',
+            "not json",
+            '{"status": "success"}',
+        ]
+    )
+    assert _pulled_bytes(body) == 15
+
+
+@pytest.mark.asyncio
+async def test_sync_records_stage_timings(monkeypatch):
+    service = OllamaIntegrationService(RoadmapConfig(current_week=1))
+    pulls = OLLAMA_SYNC_STAGES.labels("pull").count
+
+    async def fake_check():
+        return True
+
+    async def fake_pull(model_name: str):
+        pass
+
+    monkeypatch.setattr(service, "check_ollama_installed", fake_check)
+    monkeypatch.setattr(service, "pull_model", fake_pull)
+
+    await service.sync_with_roadmap()
+    assert OLLAMA_SYNC_STAGES.labels("pull").count == pulls + 2
@@ -0,0 +1,69 @@
+import asyncio
+import cProfile
+
+from src.services.profiling import (
+    ProfileStore,
+    ProfilingMiddleware,
+    RequestProfiler,
+    summarize,
+)
+
+
+def _scope(headers=(), query=b""):
+    return {"type": "http", "headers": list(headers), "query_string": query}
+
+
+def test_store_keeps_newest_profiles(tmp_path):
+    store = ProfileStore(tmp_path, max_files=2)
+    ids = [store.new_id("POST", "/roadmap/fix-sequence") for _ in range(3)]
+    for profile_id in ids:
+        store.save(profile_id, cProfile.Profile())
+    assert [e["id"] for e in store.entries()] == [ids[2], ids[1]]
+    assert store.path(ids[0]) is None
+    assert store.path(ids[2]) is not None
+    assert store.path("../etc/passwd") is None
+    (tmp_path / "notes.prof").write_text("not a profile")
+    assert len(store.entries()) == 2
+
+
+def test_summarize_renders_stats(tmp_path):
+    store = ProfileStore(tmp_path)
+    profile = cProfile.Profile()
+    profile.runcall(sorted, range(10))
+    path = store.save(store.new_id("GET", "/"), profile)
+    assert "function calls" in summarize(path)
+
+
+def test_profiler_requires_token_and_samples(tmp_path):
+    profiler = RequestProfiler(ProfileStore(tmp_path), token="secret")
+    assert profiler.wants(_scope([(b"x-profile-token", b"secret")]))
+    assert profiler.wants(_scope(query=b"limit=5&profile=secret"))
+    assert not profiler.wants(_scope([(b"x-profile-token", b"wrong")]))
+    assert not profiler.wants(_scope())
+    profiler.sample_rate = 0.0
+    assert not profiler.wants(_scope(query=b"profile=secret"))
+    assert not RequestProfiler(ProfileStore(tmp_path)).wants(_scope(query=b"profile="))
+
+
+def test_event_streams_release_the_profiling_slot(tmp_path):
+    profiler = RequestProfiler(ProfileStore(tmp_path), token="secret")
+    active_during_body = []
+
+    async def stream(scope, receive, send):
+        headers = [(b"content-type", b"text/event-stream")]
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        active_during_body.append(profiler.active)
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    async def send(message):
+        pass
+
+    scope = {
+        **_scope([(b"x-profile-token", b"secret")]),
+        "method": "GET",
+        "path": "/roadmap/events",
+    }
+    asyncio.run(ProfilingMiddleware(stream, profiler)(scope, None, send))
+    assert active_during_body == [False]
+    assert not profiler.active
+    assert len(profiler.store.entries()) == 1
@@ -0,0 +1,95 @@
+import asyncio
+import json
+
+import pytest
+from src.services.progress_events import ProgressBroker, progress_state
+
+
+def _event(frame: bytes):
+    lines = dict(line.split(": ", 1) for line in frame.decode().strip().split("\n"))
+    return lines["event"], int(lines["id"]), json.loads(lines["data"])
+
+
+def test_progress_state_flattens_config_and_progress_data():
+    config = {
+        "currentWeek": {"weekNumber": 3},
+        "phases": {"phase1": {"title": "Foundations", "status": "in_progress"}},
+    }
+    progress = {
+        "phases": [
+            {
+                "id": "foundations",
+                "progress": 40,
+                "nodes": [{"id": "git", "progress": 80}],
+            }
+        ]
+    }
+    assert progress_state(config) == {
+        "currentWeek": 3,
+        "phases.phase1.status": "in_progress",
+    }
+    assert progress_state(progress) == {
+        "phases.foundations.progress": 40,
+        "nodes.git.progress": 80,
+    }
+    assert progress_state(None) == {}
+
+
+def test_update_publishes_only_deltas():
+    broker = ProgressBroker()
+    assert broker.update({"currentWeek": 1, "nodes.a.progress": 0}) is not None
+    assert broker.update({"currentWeek": 1, "nodes.a.progress": 0}) is None
+    assert broker.seq == 1
+    delta = broker.update({"currentWeek": 2})
+    assert delta == {"set": {"currentWeek": 2}, "unset": ["nodes.a.progress"]}
+    assert broker.state == {"currentWeek": 2}
+
+
+@pytest.mark.asyncio
+async def test_stream_sends_snapshot_then_deltas():
+    broker = ProgressBroker()
+    broker.update({"currentWeek": 1})
+    stream = broker.stream()
+    assert _event(await anext(stream)) == ("snapshot", 1, {"currentWeek": 1})
+    broker.update({"currentWeek": 2})
+    assert _event(await anext(stream)) == ("delta", 2, {"set": {"currentWeek": 2}})
+    assert len(broker) == 1
+    await stream.aclose()
+    assert len(broker) == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_skips_snapshot_for_current_client():
+    broker = ProgressBroker()
+    broker.update({"currentWeek": 1})
+    stream = broker.stream(last_event_id="1")
+    next_frame = asyncio.ensure_future(anext(stream))
+    await asyncio.sleep(0)
+    broker.update({"currentWeek": 2})
+    assert _event(await next_frame)[0] == "delta"
+    await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_is_resynced_with_snapshot():
+    broker = ProgressBroker(max_pending=2)
+    stream = broker.stream()
+    await anext(stream)
+    for week in range(1, 6):
+        broker.update({"currentWeek": week})
+    assert _event(await anext(stream)) == ("snapshot", 5, {"currentWeek": 5})
+    broker.update({"currentWeek": 6})
+    assert _event(await anext(stream))[0] == "delta"
+    await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_and_close():
+    broker = ProgressBroker(heartbeat=0.01)
+    stream = broker.stream()
+    await anext(stream)
+    assert await anext(stream) == b": keepalive\n\n"
+    broker.close()
+    with pytest.raises(StopAsyncIteration):
+        await anext(stream)
+    assert len(broker) == 0
@@ -0,0 +1,119 @@
+import json
+
+from src.services.resource_search import (
+    InvertedIndex,
+    Resource,
+    ResourceSearch,
+    extract_config_resources,
+    extract_markdown_resources,
+)
+from src.services.roadmap_store import RoadmapStore
+
+
+def test_extract_config_resources(roadmap_config):
+    config = json.loads(roadmap_config.read_text())
+    resources = {r.title: r for r in extract_config_resources(config)}
+
+    book = resources["Grokking Algorithms"]
+    assert book.type == "coreLibrary"
+    assert book.phase == "Phase 1"
+    assert book.url == "https://www.manning.com/books/grokking-algorithms"
+    assert "Bhargava" in book.description
+
+    listed = resources["Python Crash Course"]
+    assert listed.type == "books"
+    assert listed.phase == "phase1"
+
+
+def test_extract_markdown_resources():
+    text = "\n".join(
+        [
+            "### Phase 1: Foundations",
+            "",
+            "| Course | Platform |",
+            "|--------|----------|",
+            "| Python 3 Programming | Coursera |",
+            "",
+            "## Books",
+            '- **"Clean Code"** by Robert Martin',
+            "See [fast.ai](https://course.fast.ai/) too.",
+        ]
+    )
+    resources = list(extract_markdown_resources("OVERVIEW.md", text))
+    assert [r.title for r in resources] == [
+        "Python 3 Programming",
+        "Clean Code",
+        "fast.ai",
+    ]
+    assert resources[0].type == "course"
+    assert resources[0].phase == "Phase 1: Foundations"
+    assert resources[2].url == "https://course.fast.ai/"
+
+
+def test_inverted_index_ranks_title_matches_first():
+    index = InvertedIndex()
+    index.add(Resource("a", "Intro to Statistics", description="python notebooks"))
+    index.add(Resource("b", "Python Crash Course", type="book"))
+    index.add(Resource("c", "Deep Learning", description="python and pytorch"))
+
+    total, page = index.search("python")
+    assert total == 3
+    assert page[0][0].id == "b"
+
+    total, page = index.search("python pytorch")
+    assert total == 1
+    assert page[0][0].id == "c"
+
+    assert index.search("missing") == (0, [])
+
+    # Cached multi-term results are dropped when the index changes
+    index.add(Resource("d", "PyTorch for Python developers"))
+    assert index.search("python pytorch")[0] == 2
+
+
+def test_inverted_index_pagination():
+    index = InvertedIndex()
+    for i in range(25):
+        index.add(Resource(f"r{i}", f"Course {i}"))
+    total, page = index.search("course", limit=10, offset=20)
+    assert total == 25
+    assert len(page) == 5
+
+
+def test_inverted_index_sync_is_incremental():
+    index = InvertedIndex()
+    assert index.sync("x:", [Resource("x:1", "Alpha"), Resource("x:2", "Beta")]) == 2
+    assert index.sync("x:", [Resource("x:1", "Alpha"), Resource("x:2", "Gamma")]) == 1
+    assert index.search("beta") == (0, [])
+    assert index.search("gamma")[0] == 1
+    assert index.sync("x:", [Resource("x:2", "Gamma")]) == 1
+    assert len(index) == 1
+    assert "alpha" not in index.postings
+
+
+def test_sync_ranks_changed_postings_up_front():
+    index = InvertedIndex()
+    index.sync(
+        "x:", [Resource(f"x:{i}", "Course", type="course" * (i % 2)) for i in range(4)]
+    )
+    # Ranked by weight, ties in doc order, before any query asks for them
+    assert index._ranked["course"] == [1, 3, 0, 2]
+    index.sync("x:", [Resource("x:0", "Course")])
+    assert index._ranked["course"] == [0]
+    assert not index._unranked
+
+
+def test_resource_search_follows_config_changes(roadmap_config, tmp_path):
+    overview = tmp_path / "OVERVIEW.md"
+    overview.write_text('- **"Clean Code"** by Robert Martin\n')
+    search = ResourceSearch(RoadmapStore(roadmap_config), [overview])
+
+    assert search.search("grokking")["total"] == 1
+    assert search.search("clean code")["total"] == 1
+
+    config = json.loads(roadmap_config.read_text())
+    config["essentialBooks"]["coreLibrary"][0]["title"] = "Algorithms Unlocked"
+    roadmap_config.write_text(json.dumps(config, indent=2))
+
+    assert search.search("unlocked")["results"][0]["url"].endswith("algorithms")
+    assert search.search("grokking")["results"][0]["title"] == "Algorithms Unlocked"
@@ -0,0 +1,60 @@
+import gzip
+
+from src.services.response_cache import (
+    RenderedResponse,
+    ResponseCache,
+    negotiate_encoding,
+    supported_encodings,
+)
+
+
+def test_negotiate_encoding():
+    assert negotiate_encoding(None) == "identity"
+    assert negotiate_encoding("gzip") == "gzip"
+    assert negotiate_encoding("gzip;q=0, deflate") == "identity"
+    assert negotiate_encoding("gzip, br") == supported_encodings()[0]
+
+
+def test_rendered_response_compresses_once():
+    rendered = RenderedResponse.from_data({"items": ["x" * 40] * 50})
+    body, encoding = rendered.encoded("gzip")
+    assert encoding == "gzip"
+    assert gzip.decompress(body) == rendered.body
+    assert rendered.encoded("gzip")[0] is body
+
+
+def test_small_bodies_are_not_compressed():
+    rendered = RenderedResponse.from_data({"ok": True})
+    assert rendered.encoded("gzip") == (rendered.body, "identity")
+
+
+def test_etag_matching():
+    rendered = RenderedResponse.from_data({"a": 1})
+    assert rendered.etag().startswith('"')
+    assert rendered.matches(rendered.etag("gzip"))
+    assert rendered.matches(f'"other", {rendered.etag()}')
+    assert not rendered.matches('"other"')
+    # Proxies may weaken the tag; If-None-Match compares weakly
+    assert rendered.matches(f"W/{rendered.etag()}")
+    assert rendered.matches(f'W/"other", W/{rendered.etag("br")}')
+    assert not rendered.matches('W/"other"')
+    assert RenderedResponse.from_data({"a": 1}).digest == rendered.digest
+
+
+def test_response_cache_reuses_and_evicts():
+    cache = ResponseCache(max_entries=2)
+    calls = []
+
+    def build(value):
+        def inner():
+            calls.append(value)
+            return value
+
+        return inner
+
+    first = cache.get("a", build(1))
+    assert cache.get("a", build(1)) is first
+    cache.get("b", build(2))
+    cache.get("c", build(3))
+    cache.get("a", build(1))
+    assert calls == [1, 2, 3, 1]
@@ -0,0 +1,86 @@
+import json
+
+from src.services.roadmap_diff import (
+    build_tree,
+    diff_configs,
+    diff_trees,
+    format_change,
+    main,
+)
+
+
+def _kinds(changes):
+    return [(c.kind, c.path) for c in changes]
+
+
+def test_identical_subtrees_share_digests():
+    a = build_tree({"metadata": {"v": 1}, "phases": {"p1": {"title": "x"}}})
+    b = build_tree({"metadata": {"v": 2}, "phases": {"p1": {"title": "x"}}})
+    assert a.children["phases"].digest == b.children["phases"].digest
+    assert a.digest != b.digest
+    assert diff_trees(a, a) == []
+
+
+def test_scalar_and_key_changes():
+    old = {"metadata": {"version": "13.0", "curator": "me"}, "keep": 1}
+    new = {"metadata": {"version": "14.0"}, "keep": 1, "extra": True}
+    changes = diff_configs(old, new)
+    assert _kinds(changes) == [
+        ("removed", "metadata.curator"),
+        ("modified", "metadata.version"),
+        ("added", "extra"),
+    ]
+    assert changes[1].old == "13.0"
+    assert changes[1].new == "14.0"
+
+
+def test_list_items_matched_by_id():
+    old = {"nodes": [{"id": "a", "p": 0}, {"id": "b", "p": 0}, {"id": "c"}]}
+    new = {"nodes": [{"id": "b", "p": 0}, {"id": "a", "p": 50}, {"id": "d"}]}
+    assert _kinds(diff_configs(old, new)) == [
+        ("removed", "nodes[2]"),
+        ("moved", "nodes[0]"),
+        ("modified", "nodes[1].p"),
+        ("added", "nodes[2]"),
+    ]
+
+
+def test_in_place_edits_and_swaps_in_lists():
+    old = {"nodes": [{"id": "a", "p": 0}, {"id": "b", "p": 0}], "tags": ["x", "y"]}
+    new = {"nodes": [{"id": "a", "p": 10}, {"id": "b", "p": 0}], "tags": ["y", "x"]}
+    assert _kinds(diff_configs(old, new)) == [
+        ("modified", "nodes[0].p"),
+        ("moved", "tags[0]"),
+    ]
+
+
+def test_phase_reorder_reports_key_positions():
+    old = {"phases": {"p2": {"order": 2}, "p1": {"order": 1}}}
+    new = {"phases": {"p1": {"order": 1}, "p2": {"order": 2}}}
+    changes = diff_configs(old, new)
+    assert _kinds(changes) == [("reordered", "phases.p1")]
+    assert (changes[0].old, changes[0].new) == (1, 0)
+    assert format_change(changes[0]) == "^ phases.p1: position 1 -> 0"
+
+
+def test_subtree_moved_between_containers():
+    node = {"id": "n1", "resources": ["a", "b"]}
+    old = {"phase1": {"items": [node]}, "phase2": {"items": []}}
+    new = {"phase1": {"items": []}, "phase2": {"items": [node]}}
+    changes = diff_configs(old, new)
+    assert len(changes) == 1
+    assert changes[0].kind == "moved"
+    assert changes[0].from_path == "phase1.items[0]"
+    assert changes[0].path == "phase2.items[0]"
+
+
+def test_cli_reports_changes(tmp_path, capsys):
+    old = tmp_path / "old.json"
+    new = tmp_path / "new.json"
+    old.write_text(json.dumps({"a": 1}))
+    new.write_text(json.dumps({"a": 2}))
+    assert main([str(old), str(new), "--json"]) == 1
+    assert json.loads(capsys.readouterr().out) == [
+        {"kind": "modified", "path": "a", "old": 1, "new": 2}
+    ]
+    assert main([str(old), str(old)]) == 0
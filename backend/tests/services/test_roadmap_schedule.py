@@ -0,0 +1,77 @@
+import json
+from datetime import date
+
+from src.services.roadmap_schedule import Interval, IntervalIndex, ScheduleIndex
+from src.services.roadmap_store import RoadmapStore
+
+
+def test_interval_index_point_lookup():
+    index = IntervalIndex(
+        [
+            Interval(date(2025, 1, 8), date(2025, 1, 14), {"n": 2}),
+            Interval(date(2025, 1, 1), date(2025, 1, 7), {"n": 1}),
+            Interval(date(2025, 1, 20), date(2025, 1, 21), {"n": 3}),
+        ]
+    )
+    assert index.at(date(2025, 1, 1)) == {"n": 1}
+    assert index.at(date(2025, 1, 14)) == {"n": 2}
+    assert index.at(date(2025, 1, 17)) is None
+    assert index.at(date(2024, 12, 31)) is None
+
+
+def test_interval_index_range_lookup():
+    index = IntervalIndex(
+        [
+            Interval(date(2025, 1, 1), date(2025, 1, 7), {"n": 1}),
+            Interval(date(2025, 1, 8), date(2025, 1, 14), {"n": 2}),
+            Interval(date(2025, 1, 15), date(2025, 1, 21), {"n": 3}),
+        ]
+    )
+    assert index.overlapping(date(2025, 1, 7), date(2025, 1, 8)) == [
+        {"n": 1},
+        {"n": 2},
+    ]
+    assert index.overlapping(date(2025, 2, 1), date(2025, 2, 2)) == []
+
+
+def test_schedule_index_from_config(roadmap_config):
+    config = json.loads(roadmap_config.read_text())
+    index = ScheduleIndex.from_config(config)
+    assert index.start_date == date(2025, 6, 21)
+
+    result = index.lookup(date(2025, 6, 24))
+    assert result["week"]["weekNumber"] == 1
+    assert result["phase"]["id"] == "phase1"
+    assert result["day"]["day"] == "tuesday"
+
+    result = index.lookup(date(2025, 7, 5))
+    assert result["week"]["weekNumber"] == 3
+    assert result["phase"]["id"] == "phase2"
+    assert result["day"] is None
+
+    assert index.lookup(date(2025, 8, 1))["week"] is None
+
+
+def test_schedule_index_tolerates_flattened_current_week():
+    index = ScheduleIndex.from_config({"currentWeek": 3, "phases": {}})
+    assert index.lookup(date(2025, 6, 24)) == {
+        "date": "2025-06-24",
+        "week": None,
+        "phase": None,
+        "day": None,
+    }
+
+
+def test_store_rebuilds_derived_values_on_change(roadmap_config):
+    store = RoadmapStore(roadmap_config)
+    first = store.derived("schedule", ScheduleIndex.from_config)
+    assert store.derived("schedule", ScheduleIndex.from_config) is first
+
+    config = json.loads(roadmap_config.read_text())
+    config["metadata"]["totalWeeks"] = 8
+    roadmap_config.write_text(json.dumps(config, indent=2))
+
+    second = store.derived("schedule", ScheduleIndex.from_config)
+    assert second is not first
+    assert len(second.weeks.intervals) == 8
+    assert store.version == 2
@@ -43,3 +43,57 @@ async def test_fix_sequence(tmp_path):
     await fixer.fix_sequence()
     data = json.loads(config_file.read_text())
     assert list(data["phases"].keys()) == ["p1", "p2"]
+
+
+@pytest.mark.asyncio
+async def test_fix_sequence_uses_config_start_date(tmp_path, monkeypatch):
+    from datetime import date
+
+    class FakeDate(date):
+        @classmethod
+        def today(cls):
+            return cls(2025, 7, 15)
+
+    monkeypatch.setattr("src.services.roadmap_sequence.date", FakeDate)
+    config_file = tmp_path / "config.json"
+    config_file.write_text(
+        '{"metadata": {"startDate": "2025-07-01"}, "phases": {}, "currentWeek": 1}'
+    )
+    await RoadmapSequenceFixer(config_file).fix_sequence()
+    assert json.loads(config_file.read_text())["currentWeek"] == 3
+
+
+@pytest.mark.asyncio
+async def test_fix_sequence_skips_unchanged_config(tmp_path, monkeypatch):
+    config_file = tmp_path / "config.json"
+    config_file.write_text('{"phases": {"p1": {"order": 1}}, "currentWeek": 1}')
+    fixer = RoadmapSequenceFixer(config_file)
+    monkeypatch.setattr(fixer, "calculate_current_week", lambda start=None: 1)
+
+    assert await fixer.fix_sequence() == []
+    assert not config_file.with_suffix(".json.bak").exists()
+
+
+@pytest.mark.asyncio
+async def test_fix_sequence_keeps_current_week_schedule(tmp_path, monkeypatch):
+    from datetime import date
+
+    class FakeDate(date):
+        @classmethod
+        def today(cls):
+            return cls(2027, 1, 1)
+
+    monkeypatch.setattr("src.services.roadmap_sequence.date", FakeDate)
+    real = Path(__file__).resolve().parents[3] / "config" / "roadmap-config-2025.json"
+    config = json.loads(real.read_text(encoding="utf-8"))
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps(config), encoding="utf-8")
+
+    await RoadmapSequenceFixer(config_file).fix_sequence()
+    current = json.loads(config_file.read_text(encoding="utf-8"))["currentWeek"]
+    # Well past the end of the roadmap, so clamped to its last week
+    assert current["weekNumber"] == config["metadata"]["totalWeeks"]
+    assert current["dailySchedule"] == config["currentWeek"]["dailySchedule"]
+
+    # Nothing left to change, so the second run writes nothing
+    assert await RoadmapSequenceFixer(config_file).fix_sequence() == []
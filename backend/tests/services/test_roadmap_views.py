@@ -0,0 +1,79 @@
+import pytest
+from src.services.roadmap_schedule import ScheduleIndex
+from src.services.roadmap_views import (
+    decode_cursor,
+    encode_cursor,
+    find_phase,
+    paginate,
+    phase_view,
+    project,
+    week_view,
+)
+
+CONFIG = {
+    "metadata": {"title": "Roadmap", "startDate": "2025-06-21", "totalWeeks": 4},
+    "currentWeek": {"weekNumber": 2, "dailySchedule": {"monday": {"date": "x"}}},
+    "phases": {
+        "phase1": {
+            "id": "phase1",
+            "title": "Foundations",
+            "startDate": "2025-06-21",
+            "endDate": "2025-07-18",
+            "keyDeliverables": ["CLI Tool (Week 1)", "Portfolio (Week 2)"],
+            "resources": {"courses": ["CS50"], "books": ["Clean Code", "SICP"]},
+            "nodes": [{"id": f"n{i}", "title": f"Node {i}"} for i in range(5)],
+        }
+    },
+}
+
+
+def test_project_selects_nested_fields():
+    assert project(CONFIG, ["metadata.title", "phases.*.title"]) == {
+        "metadata": {"title": "Roadmap"},
+        "phases": {"phase1": {"title": "Foundations"}},
+    }
+    assert project(CONFIG["phases"]["phase1"], ["nodes.id", "missing"]) == {
+        "nodes": [{"id": f"n{i}"} for i in range(5)]
+    }
+    assert project(CONFIG, []) is CONFIG
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor(42)) == 42
+    assert decode_cursor(None) == 0
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_paginate_follows_cursors():
+    items = list(range(5))
+    page, meta = paginate(items, None, 2)
+    assert page == [0, 1]
+    page, meta = paginate(items, meta["nextCursor"], 2)
+    assert page == [2, 3]
+    page, meta = paginate(items, meta["nextCursor"], 2)
+    assert page == [4]
+    assert meta == {"total": 5, "nextCursor": None}
+
+
+def test_phase_view_paginates_nodes_and_resources():
+    phase = find_phase(CONFIG, "phase1")
+    view = phase_view(phase, limit=2)
+    assert [n["id"] for n in view["nodes"]] == ["n0", "n1"]
+    assert view["resources"] == [
+        {"category": "courses", "title": "CS50"},
+        {"category": "books", "title": "Clean Code"},
+    ]
+    assert view["page"]["resources"]["total"] == 3
+    assert find_phase(CONFIG, "phase9") is None
+
+
+def test_week_view():
+    schedule = ScheduleIndex.from_config(CONFIG)
+    view = week_view(CONFIG, schedule, 2)
+    assert view["startDate"] == "2025-06-28"
+    assert view["phase"]["id"] == "phase1"
+    assert view["deliverables"] == ["Portfolio (Week 2)"]
+    assert view["dailySchedule"] == {"monday": {"date": "x"}}
+    assert week_view(CONFIG, schedule, 1)["dailySchedule"] is None
+    assert week_view(CONFIG, schedule, 5) is None
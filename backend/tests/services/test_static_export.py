@@ -0,0 +1,75 @@
+import gzip
+import json
+
+from src.services.static_export import MANIFEST_NAME, export, load_export
+
+ROADMAP = {
+    "metadata": {"title": "Roadmap", "last_updated": "2025-06-21T00:00:00Z"},
+    "currentWeek": {"weekNumber": 1, "title": "Python"},
+    "phases": [
+        {
+            "id": "phase-1",
+            "progress": 10,
+            "nodes": [{"id": "learn-python", "progress": 20}],
+            "weeks": [{"weekNumber": 1}, {"weekNumber": 2}],
+        },
+        {"id": "phase-2", "progress": 0, "nodes": []},
+    ],
+    "platforms": {"courses": ["Coursera"]},
+}
+
+
+def test_export_round_trips(tmp_path):
+    result = export(ROADMAP, tmp_path)
+    assert load_export(tmp_path) == ROADMAP
+    assert len(result.files) == 6
+    manifest = json.loads((tmp_path / MANIFEST_NAME).read_text())
+    assert manifest["metadata"] == ROADMAP["metadata"]
+    chunk = manifest["phases"][0]["chunk"]
+    assert chunk.startswith("phases/phase-1.")
+    assert (
+        gzip.decompress((tmp_path / f"{chunk}.gz").read_bytes())
+        == (tmp_path / chunk).read_bytes()
+    )
+
+
+def test_load_export_without_manifest(tmp_path):
+    assert load_export(tmp_path) is None
+
+
+def test_unchanged_chunks_keep_their_names(tmp_path):
+    first = export(ROADMAP, tmp_path)
+    updated = json.loads(json.dumps(ROADMAP))
+    updated["metadata"]["last_updated"] = "2025-06-22T00:00:00Z"
+    updated["phases"][1]["progress"] = 5
+    second = export(updated, tmp_path)
+    assert second.written == [second.manifest["phases"][1]["chunk"]]
+    assert set(first.files) - set(second.files) == {
+        first.manifest["phases"][1]["chunk"]
+    }
+    assert load_export(tmp_path) == updated
+
+
+def test_stale_chunks_outlive_one_generation(tmp_path):
+    first = export(ROADMAP, tmp_path)
+    old_chunk = first.manifest["phases"][1]["chunk"]
+    for progress in (5, 6):
+        updated = json.loads(json.dumps(ROADMAP))
+        updated["phases"][1]["progress"] = progress
+        result = export(updated, tmp_path)
+        if progress == 5:
+            assert (tmp_path / old_chunk).exists()
+    assert result.removed == [old_chunk]
+    assert not (tmp_path / old_chunk).exists()
+    assert not (tmp_path / f"{old_chunk}.gz").exists()
+
+
+def test_missing_compressed_siblings_are_regenerated(tmp_path):
+    first = export(ROADMAP, tmp_path)
+    chunk = first.manifest["phases"][0]["chunk"]
+    plain = (tmp_path / chunk).read_bytes()
+    (tmp_path / f"{chunk}.gz").unlink()
+    second = export(ROADMAP, tmp_path)
+    assert second.written == [chunk]
+    assert gzip.decompress((tmp_path / f"{chunk}.gz").read_bytes()) == plain
+    assert export(ROADMAP, tmp_path).written == []
@@ -0,0 +1,145 @@
+"""Test scripts/fetch_secrets.py against a fake 1Password CLI."""
+
+import json
+import os
+import stat
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts"))
+
+import fetch_secrets  # noqa: E402
+
+FAKE_OP = """#!{python}
+import json, os, re, sys
+
+secrets = json.loads(os.environ["FAKE_OP_SECRETS"])
+with open(os.environ["FAKE_OP_LOG"], "a") as log:
+    log.write(sys.argv[1] + "\\n")
+if sys.argv[1] == "read":
+    if sys.argv[2] not in secrets:
+        sys.exit("[ERROR] could not read secret: " + sys.argv[2])
+    print(secrets[sys.argv[2]])
+elif sys.argv[1] == "inject":
+    def resolve(match):
+        if match.group(1) not in secrets:
+            sys.exit("[ERROR] could not resolve: " + match.group(1))
+        return secrets[match.group(1)]
+    sys.stdout.write(re.sub(r"{{{{ (op://[^ ]+) }}}}", resolve, sys.stdin.read()))
+"""
+
+SECRETS = {
+    "op://Private/DB/username": "admin",
+    "op://Private/DB/password": "p@ss\nword",
+}
+
+
+@pytest.fixture
+def fake_op(tmp_path, monkeypatch) -> Path:
+    """Put a fake `op` on PATH; returns the log of its subcommands."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    op = bin_dir / "op"
+    op.write_text(FAKE_OP.format(python=sys.executable))
+    op.chmod(0o755)
+    log = tmp_path / "op.log"
+    log.touch()
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_OP_SECRETS", json.dumps(SECRETS))
+    monkeypatch.setenv("FAKE_OP_LOG", str(log))
+    return log
+
+
+def test_secrets_resolve_in_one_inject_call(fake_op):
+    uris = {"USER": "op://Private/DB/username", "PASSWORD": "op://Private/DB/password"}
+    values, failed = fetch_secrets.fetch_secrets(uris)
+    assert values == {"USER": "admin", "PASSWORD": "p@ss\nword"}
+    assert failed == []
+    assert fake_op.read_text().split() == ["inject"]
+
+
+def test_failed_inject_falls_back_to_per_secret_reads(fake_op, capsys):
+    uris = {
+        "USER": "op://Private/DB/username",
+        "MISSING": "op://Private/Nope/field",
+        "PASSWORD": "op://Private/DB/password",
+    }
+    values, failed = fetch_secrets.fetch_secrets(uris, jobs=2)
+    assert values == {"USER": "admin", "PASSWORD": "p@ss\nword"}
+    assert failed == [("MISSING", "op://Private/Nope/field")]
+    assert fake_op.read_text().split() == ["inject", "read", "read", "read"]
+    assert "could not read secret: op://Private/Nope/field" in capsys.readouterr().err
+
+
+def test_cache_is_private_and_expires(tmp_path, monkeypatch):
+    path = tmp_path / "cache" / "secrets.json"
+    fetch_secrets.save_cache(path, {"op://a": "1"}, ttl=60)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert fetch_secrets.load_cache(path, ttl=60) == {"op://a": "1"}
+
+    later = time.time() + 120
+    monkeypatch.setattr(fetch_secrets.time, "time", lambda: later)
+    assert fetch_secrets.load_cache(path, ttl=60) == {}
+    fetch_secrets.save_cache(path, {"op://b": "2"}, ttl=60)
+    assert json.loads(path.read_text()).keys() == {"op://b"}
+
+    path.chmod(0o644)
+    assert fetch_secrets.load_cache(path, ttl=60) == {}
+
+
+def _run_main(tmp_path, monkeypatch, *args: str) -> str:
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "backend").mkdir(exist_ok=True)
+    monkeypatch.setattr(sys, "argv", ["fetch_secrets.py", *args])
+    fetch_secrets.main()
+    return (tmp_path / "backend" / ".env").read_text()
+
+
+def test_main_uses_cache_on_repeat_runs(fake_op, tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        fetch_secrets, "SECRETS_TO_FETCH", {"USER": "op://Private/DB/username"}
+    )
+    monkeypatch.setattr(fetch_secrets, "CACHE_PATH", tmp_path / "cache.json")
+
+    assert _run_main(tmp_path, monkeypatch, "--cache-ttl", "60") == 'USER="admin"\n'
+    assert _run_main(tmp_path, monkeypatch, "--cache-ttl", "60") == 'USER="admin"\n'
+    assert fake_op.read_text().split() == ["inject"]
+
+
+def test_main_writes_template_without_op(tmp_path, monkeypatch):
+    monkeypatch.setenv("PATH", str(tmp_path / "empty"))
+    env = _run_main(tmp_path, monkeypatch)
+    assert 'POSTGRES_USER="REPLACE_WITH_ACTUAL_VALUE"' in env
+
+
+def test_save_cache_tightens_existing_file(tmp_path):
+    path = tmp_path / "secrets.json"
+    path.write_text("{}")
+    path.chmod(0o644)
+    fetch_secrets.save_cache(path, {"op://a": "1"}, ttl=60)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert fetch_secrets.load_cache(path, ttl=60) == {"op://a": "1"}
+
+
+@pytest.mark.parametrize("ttl", ["soon", "-5"])
+def test_main_rejects_bad_cache_ttl(tmp_path, monkeypatch, capsys, ttl):
+    monkeypatch.setenv(fetch_secrets.CACHE_TTL_ENV, ttl)
+    with pytest.raises(SystemExit) as exc:
+        _run_main(tmp_path, monkeypatch)
+    assert exc.value.code == 2
+    assert "--cache-ttl" in capsys.readouterr().err
+
+
+def test_main_serves_cache_without_op(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        fetch_secrets, "SECRETS_TO_FETCH", {"USER": "op://Private/DB/username"}
+    )
+    monkeypatch.setattr(fetch_secrets, "CACHE_PATH", tmp_path / "cache.json")
+    fetch_secrets.save_cache(
+        fetch_secrets.CACHE_PATH, {"op://Private/DB/username": "admin"}, ttl=60
+    )
+    monkeypatch.setenv("PATH", str(tmp_path / "empty"))
+    assert _run_main(tmp_path, monkeypatch, "--cache-ttl", "60") == 'USER="admin"\n'
@@ -1,6 +1,14 @@
 """Test the main API endpoints."""
 
+import asyncio
+import json
+
+import pytest
 from fastapi.testclient import TestClient
+from src.services.profiling import ProfileStore
+from src.services.static_export import export
+
+from src import main
 
 
 def test_root_endpoint(client: TestClient):
@@ -19,3 +27,251 @@ def test_health_check_endpoint(client: TestClient):
     data = response.json()
     assert data["status"] == "healthy"
     assert data["service"] == "brainwav-backend"
+
+
+def test_roadmap_schedule_by_date(client: TestClient, roadmap_config):
+    """A single date resolves to its week, phase and day entries."""
+    response = client.get("/roadmap/schedule", params={"date": "2025-06-23"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["week"]["weekNumber"] == 1
+    assert data["phase"]["id"] == "phase1"
+    assert data["day"]["morning"] == "Python basics"
+
+
+def test_roadmap_schedule_range(client: TestClient, roadmap_config):
+    """Range queries return every overlapping entry."""
+    response = client.get(
+        "/roadmap/schedule", params={"start": "2025-06-23", "end": "2025-07-06"}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [w["weekNumber"] for w in data["weeks"]] == [1, 2, 3]
+    assert [p["id"] for p in data["phases"]] == ["phase1", "phase2"]
+    assert [d["day"] for d in data["days"]] == ["monday", "tuesday"]
+
+
+def test_roadmap_schedule_rejects_bad_range(client: TestClient, roadmap_config):
+    """Inverted or half-open ranges are rejected."""
+    response = client.get(
+        "/roadmap/schedule", params={"start": "2025-07-06", "end": "2025-06-23"}
+    )
+    assert response.status_code == 400
+    response = client.get("/roadmap/schedule", params={"start": "2025-07-06"})
+    assert response.status_code == 400
+
+
+def test_search_endpoint(client: TestClient, roadmap_config):
+    """Search returns ranked, paginated resources."""
+    response = client.get("/search", params={"q": "grokking", "limit": 5})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 1
+    assert data["limit"] == 5
+    assert data["results"][0]["title"] == "Grokking Algorithms"
+
+
+def test_search_endpoint_requires_query(client: TestClient, roadmap_config):
+    """An empty query is a validation error."""
+    assert client.get("/search", params={"q": ""}).status_code == 422
+
+
+def test_roadmap_projection_and_etag(client: TestClient, roadmap_config):
+    """Projected roadmap reads carry a strong ETag and honour If-None-Match."""
+    response = client.get("/roadmap", params={"fields": "metadata.title"})
+    assert response.status_code == 200
+    assert response.json() == {"metadata": {"title": "Test Roadmap"}}
+    etag = response.headers["etag"]
+
+    response = client.get(
+        "/roadmap",
+        params={"fields": "metadata.title"},
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+
+    response = client.get(
+        "/roadmap",
+        params={"fields": "metadata.title"},
+        headers={"If-None-Match": f"W/{etag}"},
+    )
+    assert response.status_code == 304
+
+
+def test_roadmap_is_compressed(client: TestClient, roadmap_config):
+    """Large bodies are gzip encoded when the client accepts it."""
+    response = client.get("/roadmap", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"].endswith('-gzip"')
+    assert response.json()["metadata"]["totalWeeks"] == 4
+
+
+def test_roadmap_etag_changes_with_config(client: TestClient, roadmap_config):
+    """Editing the config yields a new representation and ETag."""
+    first = client.get("/roadmap").headers["etag"]
+    config = json.loads(roadmap_config.read_text())
+    config["metadata"]["title"] = "Renamed"
+    roadmap_config.write_text(json.dumps(config, indent=2))
+    response = client.get("/roadmap", headers={"If-None-Match": first})
+    assert response.status_code == 200
+    assert response.json()["metadata"]["title"] == "Renamed"
+
+
+def test_roadmap_phase_pagination(client: TestClient, roadmap_config):
+    """Phase reads paginate resources with opaque cursors."""
+    response = client.get("/roadmap/phases/phase1", params={"limit": 1})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["resources"] == [{"category": "books", "title": "Python Crash Course"}]
+    assert data["page"]["resources"]["nextCursor"] is None
+
+    assert client.get("/roadmap/phases/missing").status_code == 404
+    response = client.get("/roadmap/phases/phase1", params={"nodes_cursor": "!!"})
+    assert response.status_code == 400
+
+
+def test_roadmap_week(client: TestClient, roadmap_config):
+    """Week reads resolve dates and phase from the schedule index."""
+    response = client.get("/roadmap/weeks/3", params={"fields": "startDate,phase.id"})
+    assert response.status_code == 200
+    assert response.json() == {"startDate": "2025-07-05", "phase": {"id": "phase2"}}
+    assert client.get("/roadmap/weeks/9").status_code == 404
+
+
+def test_roadmap_events_stream(client: TestClient, roadmap_config, monkeypatch):
+    progress = {"phases": [{"id": "p1", "progress": 10, "nodes": []}]}
+    export(progress, roadmap_config.parent / "data")
+    # A closed broker ends the stream after the initial snapshot
+    main.progress_broker.close()
+    response = client.get("/roadmap/events")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    event, data = response.text.split("\n")[1:3]
+    assert event == "event: snapshot"
+    assert json.loads(data.removeprefix("data: ")) == {
+        "currentWeek": 1,
+        "phases.p1.progress": 10,
+    }
+
+
+def test_truncated_config_keeps_last_progress(roadmap_config):
+    """A config caught mid-write must not publish a delta unsetting every key."""
+    main.publish_progress()
+    seq, state = main.progress_broker.seq, main.progress_broker.state
+    assert state["currentWeek"] == 1
+
+    text = roadmap_config.read_text()
+    roadmap_config.write_text(text[: len(text) // 2])
+    main.publish_progress()
+    # Cut inside a multi-byte character, so decoding fails before parsing
+    roadmap_config.write_bytes(b'{"icon": "' + "🧩".encode()[:2])
+    main.publish_progress()
+    roadmap_config.unlink()
+    main.publish_progress()
+    # A manifest that parses but is missing its chunk index
+    manifest = roadmap_config.parent / "data" / "manifest.json"
+    manifest.parent.mkdir()
+    manifest.write_text("{}")
+    main.publish_progress()
+    assert main.progress_broker.seq == seq
+    assert main.progress_broker.state == state
+
+    roadmap_config.write_text(text.replace('"weekNumber": 1', '"weekNumber": 2'))
+    main.publish_progress()
+    assert main.progress_broker.state["currentWeek"] == 2
+
+
+def test_progress_watcher_survives_failed_polls(monkeypatch):
+    calls = []
+
+    def publish() -> None:
+        calls.append(None)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        if len(calls) == 3:
+            raise asyncio.CancelledError
+
+    monkeypatch.setattr(main, "publish_progress", publish)
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(main._watch_progress(0))
+    assert len(calls) == 3
+
+
+def test_metrics_endpoint(client: TestClient, roadmap_config):
+    client.get("/roadmap")
+    client.get("/roadmap")
+    client.post("/roadmap/fix-sequence")
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/roadmap",status="200"}'
+        in text
+    )
+    assert 'cache_requests_total{cache="responses",result="hit"}' in text
+    assert 'roadmap_fix_sequence_stage_seconds_count{stage="load"}' in text
+
+
+def test_profiling_disabled_without_token(client: TestClient):
+    response = client.get("/health", headers={"X-Profile-Token": "anything"})
+    assert "x-profile-id" not in response.headers
+    assert client.get("/admin/profiles").status_code == 404
+
+
+def test_profiled_request_is_downloadable(
+    client: TestClient, roadmap_config, monkeypatch, tmp_path
+):
+    monkeypatch.setattr(main.request_profiler, "token", "secret")
+    monkeypatch.setattr(main.request_profiler, "store", ProfileStore(tmp_path / "p"))
+    auth = {"X-Profile-Token": "secret"}
+
+    assert "x-profile-id" not in client.get("/roadmap").headers
+    profile_id = client.post(
+        "/roadmap/fix-sequence", params={"profile": "secret"}
+    ).headers["x-profile-id"]
+    assert "roadmap_fix-sequence" in profile_id
+
+    assert client.get("/admin/profiles").status_code == 403
+    listing = client.get("/admin/profiles", headers=auth).json()
+    assert [p["id"] for p in listing["profiles"]] == [profile_id]
+    download = client.get(f"/admin/profiles/{profile_id}", headers=auth)
+    assert download.headers["content-type"] == "application/octet-stream"
+    assert len(download.content) > 0
+    text = client.get(
+        f"/admin/profiles/{profile_id}", params={"format": "text"}, headers=auth
+    )
+    assert "fix_sequence" in text.text
+    missing = client.get("/admin/profiles/0-0-missing", headers=auth)
+    assert missing.status_code == 404
+    bad_format = client.get(
+        f"/admin/profiles/{profile_id}", params={"format": "xml"}, headers=auth
+    )
+    assert bad_format.status_code == 400
+
+
+def test_create_app_builds_independent_apps():
+    from src.main import create_app
+
+    first, second = create_app(), create_app()
+    assert first is not second
+    assert TestClient(second).get("/health").json()["status"] == "healthy"
+
+
+def test_import_defers_network_dependencies():
+    """Importing the app must not load requests; only Ollama pulls need it."""
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    code = "import sys, src.main; print('requests' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).resolve().parents[1],
+    )
+    assert result.stdout.strip() == "False"
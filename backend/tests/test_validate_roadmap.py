@@ -0,0 +1,42 @@
+"""Test URL selection in scripts/validate_roadmap.py."""
+
+import copy
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts"))
+
+import validate_roadmap  # noqa: E402
+
+BASELINE = {
+    "phases": [
+        {
+            "id": "phase-1",
+            "nodes": [
+                {"id": "a", "resources": [{"title": "A", "url": "https://a.example"}]},
+                {"id": "b", "resources": [{"title": "B"}]},
+            ],
+        }
+    ]
+}
+
+
+def test_changed_urls_include_url_added_to_existing_entry():
+    data = copy.deepcopy(BASELINE)
+    data["phases"][0]["nodes"][1]["resources"][0]["url"] = "https://b.example"
+    assert validate_roadmap.extract_changed_urls(BASELINE, data) == [
+        "https://b.example"
+    ]
+
+
+def test_changed_urls_include_modified_and_new_subtrees():
+    data = copy.deepcopy(BASELINE)
+    data["phases"][0]["nodes"][0]["resources"][0]["url"] = "https://a2.example"
+    data["phases"][0]["nodes"].append(
+        {"id": "c", "resources": [{"title": "C", "url": "https://c.example"}]}
+    )
+    assert sorted(validate_roadmap.extract_changed_urls(BASELINE, data)) == [
+        "https://a2.example",
+        "https://c.example",
+    ]
+    assert validate_roadmap.extract_changed_urls(BASELINE, BASELINE) == []
@@ -7,21 +7,53 @@
 const { readFileSync, writeFileSync, mkdirSync, existsSync } = require('fs');
 const { join } = require('path');
 
-const LEGACY_PATH = join(__dirname, '../../frontend/public/data/roadmap.json');
+const DATA_DIR = join(__dirname, '../../frontend/public/data');
+// Chunked export written by scripts/ai/update_roadmap_progress.py
+const MANIFEST_PATH = join(DATA_DIR, 'manifest.json');
+// Monolithic file the chunked export replaced
+const LEGACY_PATH = join(DATA_DIR, 'roadmap.json');
 const OUTPUT_PATH = join(__dirname, '../content');
 
+/**
+ * Rebuild the full roadmap from manifest.json and its chunks; mirrors
+ * assemble() in backend/src/services/static_export.py.
+ */
+function loadExport(root, manifest) {
+  const load = (name) => JSON.parse(readFileSync(join(root, name), 'utf8'));
+  const data = { metadata: manifest.metadata, ...load(manifest.core) };
+  if (manifest.currentWeek) {
+    data.currentWeek = load(manifest.currentWeek);
+  }
+  const phases = manifest.phases.map((entry) => {
+    const phase = load(entry.chunk);
+    return [entry.id, entry.weeks ? { ...phase, weeks: entry.weeks.map(load) } : phase];
+  });
+  data.phases =
+    manifest.phasesForm === 'dict'
+      ? Object.fromEntries(phases)
+      : phases.map(([, phase]) => phase);
+  return data;
+}
+
+function loadRoadmap() {
+  if (existsSync(MANIFEST_PATH)) {
+    console.log(`📂 Reading chunked export from: ${MANIFEST_PATH}`);
+    return loadExport(DATA_DIR, JSON.parse(readFileSync(MANIFEST_PATH, 'utf8')));
+  }
+  if (!existsSync(LEGACY_PATH)) {
+    throw new Error(`No roadmap export found at: ${MANIFEST_PATH} or ${LEGACY_PATH}`);
+  }
+  console.log(`📂 Reading from: ${LEGACY_PATH}`);
+  return JSON.parse(readFileSync(LEGACY_PATH, 'utf8'));
+}
+
 async function main() {
   try {
     console.log('🚀 Starting roadmap migration...');
-    console.log(`📂 Reading from: ${LEGACY_PATH}`);
     console.log(`📁 Output to: ${OUTPUT_PATH}`);
 
-    if (!existsSync(LEGACY_PATH)) {
-      throw new Error(`Legacy roadmap file not found at: ${LEGACY_PATH}`);
-    }
-
     console.log('📖 Reading legacy roadmap data...');
-    const legacyData = JSON.parse(readFileSync(LEGACY_PATH, 'utf8'));
+    const legacyData = loadRoadmap();
     console.log(`✅ Loaded legacy data with ${legacyData.phases?.length || 0} phases`);
 
     if (!existsSync(OUTPUT_PATH)) {
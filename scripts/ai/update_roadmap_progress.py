@@ -5,11 +5,20 @@ Auto-update roadmap progress based on GitHub activity and external APIs
 
 import json
 import os
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import requests  # type: ignore
+BACKEND_DIR = Path(__file__).resolve().parents[2] / "backend"
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from src.services.static_export import export, load_export  # noqa: E402
+
+DATA_DIR = Path("frontend/public/data")
+# Monolithic file written before the chunked export; migrated on first run
+LEGACY_DATA_FILE = DATA_DIR / "roadmap.json"
 
 
 class RoadmapProgressTracker:
@@ -21,6 +30,8 @@ class RoadmapProgressTracker:
 
     def get_github_activity(self) -> dict[str, Any]:
         """Get recent GitHub activity for progress tracking"""
+        import requests  # type: ignore  # deferred: slow to import
+
         headers = {"Authorization": f"token {self.github_token}"}
 
         # Get user repositories
@@ -52,16 +63,14 @@ class RoadmapProgressTracker:
         return project_status
 
     def update_roadmap_json(self) -> dict[str, Any]:
-        """Update the roadmap.json file with current progress"""
-        data_file = Path("frontend/public/data/roadmap.json")
-
-        # Ensure directory exists
-        data_file.parent.mkdir(parents=True, exist_ok=True)
-
+        """Update the chunked roadmap export with current progress"""
         # Load existing data or create new
-        if data_file.exists():
-            with open(data_file) as f:
-                roadmap_data: dict[str, Any] = json.load(f)
+        existing = load_export(DATA_DIR)
+        if existing is not None:
+            roadmap_data: dict[str, Any] = existing
+        elif LEGACY_DATA_FILE.exists():
+            with open(LEGACY_DATA_FILE) as f:
+                roadmap_data = json.load(f)
         else:
             roadmap_data = self.create_initial_roadmap()
 
@@ -105,11 +114,15 @@ class RoadmapProgressTracker:
                 else:
                     phase["status"] = "not_started"
 
-        # Save updated data
-        with open(data_file, "w") as f:
-            json.dump(roadmap_data, f, indent=2)
+        # Save updated data; unchanged chunks keep their hashed names
+        result = export(roadmap_data, DATA_DIR)
+        LEGACY_DATA_FILE.unlink(missing_ok=True)
 
-        print(f"✅ Roadmap updated: {data_file}")
+        print(
+            f"✅ Roadmap updated: {DATA_DIR / 'manifest.json'} "
+            f"({len(result.written)}/{len(result.files)} chunks changed, "
+            f"{result.bytes_written / 1024:.1f} KB written)"
+        )
         return roadmap_data
 
     def create_initial_roadmap(self) -> dict[str, Any]:
@@ -1,7 +1,17 @@
 # scripts/fetch_secrets.py
+from __future__ import annotations
+
+import argparse
+import json
 import os
+import secrets
+import shutil
 import subprocess
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 # Define the secrets you need for your application.
 # The format is: EnvironmentVariableName="op://vault/item/field"
@@ -16,58 +26,227 @@ SECRETS_TO_FETCH = {
 # The name of the environment file to be created in the `backend` directory.
 ENV_FILE_PATH = os.path.join("backend", ".env")
 
+# Upper bound on concurrent `op read` calls when the batched call fails
+MAX_PARALLEL_READS = 4
+
+# Optional local cache of resolved secrets, off unless a TTL is given.
+# Readable by the current user only; ignored if its permissions are looser.
+CACHE_TTL_ENV = "FETCH_SECRETS_CACHE_TTL"
+CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    / "brainwav"
+    / "secrets.json"
+)
+
 
-def fetch_secret(op_uri: str) -> str:
-    """Uses the 1Password CLI to fetch a secret for a given URI."""
+def _op_missing() -> None:
+    print("❌ Error: 'op' command not found.", file=sys.stderr)
+    print(
+        "   Please ensure the 1Password CLI is installed and in your PATH.",
+        file=sys.stderr,
+    )
+    print(
+        "   For installation instructions: https://developer.1password.com/docs/cli/get-started/",
+        file=sys.stderr,
+    )
+
+
+def _read(op_uri: str) -> tuple[str | None, str]:
+    """Run `op read` for one URI; returns (value, error details)."""
     try:
         # The 'op read' command securely retrieves the secret value.
         result = subprocess.run(
             ["op", "read", op_uri], capture_output=True, text=True, check=True
         )
-        # Return the secret value, stripping any trailing newlines.
-        return result.stdout.strip()
     except subprocess.CalledProcessError as e:
-        print(f"❌ Error fetching secret for URI: {op_uri}", file=sys.stderr)
-        print(f"   Error details: {e.stderr.strip()}", file=sys.stderr)
-        print(
-            "   Please ensure you are logged into the 1Password CLI (`op signin`) and have access to this vault.",
-            file=sys.stderr,
+        return None, e.stderr.strip()
+    # Return the secret value, stripping any trailing newlines.
+    return result.stdout.strip(), ""
+
+
+def _report_failure(op_uri: str, details: str) -> None:
+    print(f"❌ Error fetching secret for URI: {op_uri}", file=sys.stderr)
+    print(f"   Error details: {details}", file=sys.stderr)
+    print(
+        "   Please ensure you are logged into the 1Password CLI (`op signin`) and have access to this vault.",
+        file=sys.stderr,
+    )
+
+
+def inject_secrets(uris: dict[str, str]) -> dict[str, str] | None:
+    """Resolve every URI with a single `op inject` call.
+
+    `op inject` fails as a whole if any reference fails, so None means
+    "fall back to reading secrets one by one".
+    """
+    # Each value follows a random boundary line, so multi-line secrets survive
+    boundary = f"--{secrets.token_hex(16)}--"
+    template = "".join(
+        f"{boundary}{name}\n{{{{ {uri} }}}}\n" for name, uri in uris.items()
+    )
+    try:
+        result = subprocess.run(
+            ["op", "inject"], input=template, capture_output=True, text=True
         )
-        return None
     except FileNotFoundError:
-        print("❌ Error: 'op' command not found.", file=sys.stderr)
-        print(
-            "   Please ensure the 1Password CLI is installed and in your PATH.",
-            file=sys.stderr,
-        )
-        print(
-            "   For installation instructions: https://developer.1password.com/docs/cli/get-started/",
-            file=sys.stderr,
-        )
         return None
+    if result.returncode != 0:
+        return None
+    values = {}
+    for block in result.stdout.split(boundary)[1:]:
+        name, _, value = block.partition("\n")
+        values[name] = value.strip()
+    return values if values.keys() == uris.keys() else None
+
+
+def fetch_secrets(
+    uris: dict[str, str], jobs: int = MAX_PARALLEL_READS
+) -> tuple[dict[str, str], list[tuple[str, str]]]:
+    """Resolve ``{env var: op URI}``; returns (values, [(env var, URI)] failed).
+
+    Tries one batched `op inject` first. If that fails, reads each secret
+    with at most ``jobs`` concurrent `op read` calls, so every failing
+    secret is still reported on its own.
+    """
+    if not uris:
+        return {}, []
+    values = inject_secrets(uris)
+    if values is not None:
+        return values, []
+
+    names = list(uris)
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(names)))) as pool:
+        try:
+            results = list(pool.map(lambda name: _read(uris[name]), names))
+        except FileNotFoundError:
+            _op_missing()
+            return {}, [(name, uris[name]) for name in names]
+
+    values, failed = {}, []
+    # Report in declaration order, not completion order
+    for name, (value, details) in zip(names, results, strict=True):
+        if value is None:
+            _report_failure(uris[name], details)
+            failed.append((name, uris[name]))
+        else:
+            values[name] = value
+    return values, failed
+
+
+def load_cache(path: Path, ttl: float) -> dict[str, str]:
+    """Cached ``{op URI: value}`` entries younger than ``ttl`` seconds."""
+    try:
+        st = path.stat()
+        # Refuse caches other users could read or that someone else wrote
+        if st.st_mode & 0o077 or st.st_uid != os.getuid():
+            return {}
+        entries = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    now = time.time()
+    return {
+        uri: entry["value"]
+        for uri, entry in entries.items()
+        if isinstance(entry, dict) and 0 <= now - entry.get("fetched", 0) < ttl
+    }
+
+
+def save_cache(path: Path, values: dict[str, str], ttl: float) -> None:
+    """Merge ``{op URI: value}`` into the cache, dropping expired entries."""
+    now = time.time()
+    try:
+        entries = json.loads(path.read_text())
+        if not isinstance(entries, dict):
+            entries = {}
+    except (OSError, ValueError):
+        entries = {}
+    entries = {
+        uri: entry
+        for uri, entry in entries.items()
+        if isinstance(entry, dict) and now - entry.get("fetched", 0) < ttl
+    }
+    entries.update({uri: {"value": v, "fetched": now} for uri, v in values.items()})
+
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    # mkstemp creates the file 0600, so secrets are never readable by others;
+    # replacing the old file also drops any looser mode it had
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w") as f:
+            os.fchmod(f.fileno(), 0o600)
+            json.dump(entries, f)
+        os.replace(tmp, path)
+    finally:
+        Path(tmp).unlink(missing_ok=True)
+
+
+def _ttl(text: str) -> float:
+    """argparse type for cache TTLs: a non-negative number of seconds."""
+    try:
+        ttl = float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid TTL: {text!r}") from None
+    if not ttl >= 0:
+        raise argparse.ArgumentTypeError(f"TTL must be 0 or more seconds: {text!r}")
+    return ttl
 
 
 def main() -> None:
     """Main function to fetch all defined secrets and write them to a .env file."""
+    parser = argparse.ArgumentParser(description="Write backend/.env from 1Password.")
+    parser.add_argument(
+        "--cache-ttl",
+        type=_ttl,
+        # A string default goes through _ttl too, so bad values are reported
+        default=os.environ.get(CACHE_TTL_ENV, "0"),
+        help=f"reuse secrets cached at {CACHE_PATH} for this many seconds "
+        f"(default: ${CACHE_TTL_ENV} or 0, meaning no cache)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=MAX_PARALLEL_READS,
+        help="concurrent `op read` calls when the batched call fails",
+    )
+    args = parser.parse_args()
+
     print("🔑 Fetching secrets for the brAInwav project...")
-    
+
+    cached = load_cache(CACHE_PATH, args.cache_ttl) if args.cache_ttl > 0 else {}
+    pending = {name: uri for name, uri in SECRETS_TO_FETCH.items() if uri not in cached}
+    hits = len(SECRETS_TO_FETCH) - len(pending)
+    if hits:
+        print(f"   - Using {hits} cached secrets")
+
     # Check if 1Password CLI is available
-    if not subprocess.run(["command", "-v", "op"], capture_output=True).returncode == 0:
+    if pending and shutil.which("op") is None:
         print("❌ 1Password CLI not found.", file=sys.stderr)
-        print("   Creating a template .env file instead...", file=sys.stderr)
-        create_env_template()
-        return
-    
+        if not hits:
+            print("   Creating a template .env file instead...", file=sys.stderr)
+            create_env_template()
+            return
+        # Write what the cache has; the rest are reported as failures below
+        fetched: dict[str, str] = {}
+        failed_secrets = list(pending.items())
+    else:
+        if pending:
+            print(f"   - Fetching {', '.join(pending)}...")
+        fetched, failed_secrets = fetch_secrets(pending, args.jobs)
+    if args.cache_ttl > 0 and fetched:
+        try:
+            save_cache(
+                CACHE_PATH,
+                {pending[name]: value for name, value in fetched.items()},
+                args.cache_ttl,
+            )
+        except OSError as e:
+            print(f"⚠️  Could not update secrets cache: {e}", file=sys.stderr)
+
     env_content = []
-    failed_secrets = []
-    
     for env_var, op_uri in SECRETS_TO_FETCH.items():
-        print(f"   - Fetching {env_var}...")
-        secret_value = fetch_secret(op_uri)
+        secret_value = cached.get(op_uri, fetched.get(env_var))
         if secret_value is not None:
             env_content.append(f'{env_var}="{secret_value}"')
-        else:
-            failed_secrets.append((env_var, op_uri))
 
     # If we have any successful secrets, write them to .env
     if env_content:
@@ -79,7 +258,7 @@ def main() -> None:
         except OSError as e:
             print(f"❌ Error writing to .env file at {ENV_FILE_PATH}: {e}", file=sys.stderr)
             sys.exit(1)
-    
+
     # If we had failures, provide guidance
     if failed_secrets:
         print(f"\n⚠️  Failed to fetch {len(failed_secrets)} secrets:", file=sys.stderr)
@@ -89,7 +268,7 @@ def main() -> None:
         print("   1. Ensure you're logged into 1Password CLI: op signin", file=sys.stderr)
         print("   2. Verify you have access to the specified vaults", file=sys.stderr)
         print("   3. Or manually set these variables in backend/.env", file=sys.stderr)
-        
+
         if not env_content:
             print("\n   Creating a template .env file with placeholder values...", file=sys.stderr)
             create_env_template()
@@ -101,12 +280,12 @@ def create_env_template() -> None:
     template_content.append("# Environment variables for brAInwav project")
     template_content.append("# Replace placeholder values with actual secrets")
     template_content.append("")
-    
+
     for env_var, op_uri in SECRETS_TO_FETCH.items():
         template_content.append(f"# From: {op_uri}")
         template_content.append(f'{env_var}="REPLACE_WITH_ACTUAL_VALUE"')
         template_content.append("")
-    
+
     try:
         with open(ENV_FILE_PATH, "w") as f:
             f.write("\n".join(template_content))
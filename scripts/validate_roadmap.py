@@ -5,6 +5,7 @@ Validation script for roadmap JSON files and resource links.
 
 from __future__ import annotations
 
+import argparse
 import json
 import os
 import sys
@@ -12,8 +13,6 @@ from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
-import requests
-
 # URLs that require authentication and should not fail validation
 AUTH_REQUIRED_DOMAINS = {
     "www.datacamp.com",
@@ -108,6 +107,9 @@ def validate_url(url: str, timeout: int = 10) -> tuple[bool, str, str]:
     Validate that a URL is accessible.
     Returns (is_valid, message, category) where category is 'error', 'warning', or 'info'
     """
+    # Imported on first use so structure-only runs skip its slow import
+    import requests
+
     try:
         parsed = urlparse(url)
         if not parsed.scheme or not parsed.netloc:
@@ -169,8 +171,37 @@ def extract_urls_from_roadmap(data: dict[str, Any]) -> list[str]:
     return urls
 
 
+def extract_changed_urls(baseline: dict[str, Any], data: dict[str, Any]) -> list[str]:
+    """Extract URLs only from the subtrees that differ from ``baseline``."""
+    backend = str(Path(__file__).resolve().parents[1] / "backend")
+    if backend not in sys.path:
+        sys.path.insert(0, backend)
+    from src.services.roadmap_diff import diff_configs
+
+    urls: list[str] = []
+    for change in diff_configs(baseline, data):
+        if change.kind in ("added", "modified") and isinstance(change.new, dict | list):
+            urls.extend(extract_urls_from_roadmap({"_": change.new}))
+        elif (
+            change.kind in ("added", "modified")
+            and change.path.rsplit(".", 1)[-1] == "url"
+            and isinstance(change.new, str)
+        ):
+            urls.append(change.new)
+    return urls
+
+
 def main() -> None:
     """Main validation function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="directory holding a previous copy of roadmaps/; only URLs in "
+        "changed subtrees are checked",
+    )
+    args = parser.parse_args()
+
     print("🔍 Validating roadmap files and resources...")
 
     # Check if running in CI environment
@@ -215,7 +246,17 @@ def main() -> None:
             print("✅ Structure validation passed")
 
         # Validate URLs
-        urls = extract_urls_from_roadmap(data)
+        baseline_file = (
+            args.baseline / json_file.relative_to(roadmaps_dir)
+            if args.baseline
+            else None
+        )
+        if baseline_file is not None and baseline_file.exists():
+            with open(baseline_file) as f:
+                urls = extract_changed_urls(json.load(f), data)
+            print(f"ℹ️  Checking only URLs changed since {baseline_file}")
+        else:
+            urls = extract_urls_from_roadmap(data)
         if urls:
             print(f"🔗 Checking {len(urls)} URLs...")
             for url in urls: